@@ -1,6 +1,7 @@
 import numpy as np
-from composipy import OrthotropicMaterial, LaminateProperty, LaminateStrength
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import astuple, dataclass, fields, replace
+from itertools import chain
 from typing import List, Dict, Tuple
 
 @dataclass
@@ -12,114 +13,256 @@ class PlyProperties:
     thickness: float  # Ply thickness (mm)
     orientation: float  # Fiber orientation angle (degrees)
     density: float = 1600  # Density (kg/m³)
+    Xt: float = 1500  # Longitudinal tensile strength (MPa)
+    Yt: float = 40  # Transverse tensile strength (MPa)
+    S12: float = 68  # In-plane shear strength (MPa)
+
+# Number of columns in a ply property array, one per PlyProperties field
+_N_PLY_FIELDS = len(fields(PlyProperties))
+
+# Load sets whose stress/strain results are kept per layup. The cache serves
+# repeated queries of the same loads (e.g. several failure criteria); sweeps over
+# many distinct loads would only fill it, so it is kept small.
+_STRESS_CACHE_SIZE = 8
 
 class CompositeAnalysis:
     def __init__(self, plies: List[PlyProperties]):
         self.plies = plies
-        self.total_thickness = sum(ply.thickness for ply in plies)
-        
-        # Create composipy materials and laminate
-        self.materials = self._create_materials()
-        self.laminate = self._create_laminate()
-    
-    def _create_materials(self) -> List[OrthotropicMaterial]:
-        """Create OrthotropicMaterial objects for each ply"""
-        materials = []
-        for ply in self.plies:
-            # Convert to composipy material format
-            materials.append(OrthotropicMaterial(
-                e1=ply.E11 * 1e9,  # Convert to Pa
-                e2=ply.E22 * 1e9,
-                v12=ply.nu12,
-                g12=ply.G12 * 1e9,
-                thickness=ply.thickness * 1e-3,  # Convert to m
-                theta=ply.orientation
-            ))
-        return materials
-    
-    def _create_laminate(self) -> LaminateProperty:
-        """Create a LaminateProperty object"""
-        return LaminateProperty(self.materials)
+        
+        # All ply properties as one (N, fields) array, in PlyProperties field order
+        data = np.array([astuple(ply) for ply in plies], dtype=float).reshape(-1, _N_PLY_FIELDS)
+        self._set_ply_arrays(data)
+    
+    @classmethod
+    def from_arrays(cls, E11, E22, nu12, G12, thickness, orientation,
+                    density=1600, Xt=1500, Yt=40, S12=68) -> 'CompositeAnalysis':
+        """
+        Create a layup from per-ply property arrays, in the units of PlyProperties
+        
+        Scalars are broadcast over all plies. The stiffness and stress calculations
+        use the arrays directly rather than re-reading them from the ply objects.
+        """
+        data = np.column_stack(np.broadcast_arrays(
+            E11, E22, nu12, G12, thickness, orientation, density, Xt, Yt, S12
+        )).astype(float)
+        
+        layup = cls.__new__(cls)
+        layup.plies = [PlyProperties(*row) for row in data.tolist()]
+        layup._set_ply_arrays(data)
+        return layup
+    
+    def _set_ply_arrays(self, data: np.ndarray):
+        """Set up the laminate from an (N, fields) array of ply properties"""
+        E11, E22, nu12, G12, thickness, orientation = data[:, :6].T
+        self.total_thickness = thickness.sum()
+        
+        # Ply stiffnesses, interface coordinates and laminate compliance for the
+        # stress/strain calculations, which only depend on the plies
+        self._trig = self._get_trig_table(np.radians(orientation))
+        # Double-angle terms, for the stiffness and for rotating ply stresses and
+        # strains to material axes
+        _, _, cc, ss, cs = self._trig
+        self._c2, self._s2 = cc - ss, 2*cs
+        self._Q_bar = self._get_Q_bar_stack(E11 * 1e9, E22 * 1e9, nu12, G12 * 1e9, self._c2, self._s2)
+        self._E = data[:, [0, 1, 3]] * 1e9
+        self._strength = data[:, 7:10] * 1e6
+        self._z = self._get_z_edges(thickness * 1e-3)
+        self._S = self._get_compliance_matrix()
+        
+        # Stress/strain results per set of loads, only valid for these plies,
+        # least recently used first
+        self._stress_strain_cache = OrderedDict()
+    
+    @staticmethod
+    def _get_trig_table(theta: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """
+        cos, sin and their products for every ply angle (radians), as (c, s, c², s², cs)
+        
+        Computed once per layup; the stiffness and stress rotations only combine these.
+        """
+        c = np.cos(theta)
+        s = np.sin(theta)
+        return c, s, c*c, s*s, c*s
+    
+    @staticmethod
+    def _get_Q_bar_stack(E11: np.ndarray, E22: np.ndarray, nu12: np.ndarray, G12: np.ndarray,
+                         c2: np.ndarray, s2: np.ndarray) -> np.ndarray:
+        """
+        Transformed reduced stiffness matrices of all plies (Pa), shape (N, 3, 3), from
+        SI arrays and the cosine and sine of twice the ply angles
+        """
+        denom = 1 - nu12**2 * E22 / E11
+        Q11 = E11 / denom
+        Q22 = E22 / denom
+        Q12 = nu12 * E22 / denom
+        Q66 = G12
+        
+        # Tsai-Pagano invariants
+        U1 = (3*Q11 + 3*Q22 + 2*Q12 + 4*Q66) / 8
+        U2 = (Q11 - Q22) / 2
+        U3 = (Q11 + Q22 - 2*Q12 - 4*Q66) / 8
+        U4 = (Q11 + Q22 + 6*Q12 - 4*Q66) / 8
+        U5 = (Q11 + Q22 - 2*Q12 + 4*Q66) / 8
+        # Quadruple angles from the double angles
+        c4, s4 = c2*c2 - s2*s2, 2*c2*s2
+        
+        Q_bar = np.empty((len(c2), 3, 3))
+        Q_bar[:, 0, 0] = U1 + U2*c2 + U3*c4
+        Q_bar[:, 1, 1] = U1 - U2*c2 + U3*c4
+        Q_bar[:, 0, 1] = Q_bar[:, 1, 0] = U4 - U3*c4
+        Q_bar[:, 2, 2] = U5 - U3*c4
+        Q_bar[:, 0, 2] = Q_bar[:, 2, 0] = 0.5*U2*s2 + U3*s4
+        Q_bar[:, 1, 2] = Q_bar[:, 2, 1] = 0.5*U2*s2 - U3*s4
+        return Q_bar
+    
+    def _get_z_edges(self, t: np.ndarray) -> np.ndarray:
+        """Ply interface coordinates (m) from bottom to top surface, from the ply thicknesses (m)"""
+        h = t.sum()
+        return np.concatenate(([-h / 2], np.cumsum(t) - h / 2))
+    
+    def _get_compliance_matrix(self) -> np.ndarray:
+        """Inverse of the 6x6 ABD matrix"""
+        z = self._z
+        A = np.einsum('p,pij->ij', z[1:] - z[:-1], self._Q_bar)
+        B = np.einsum('p,pij->ij', (z[1:]**2 - z[:-1]**2) / 2, self._Q_bar)
+        D = np.einsum('p,pij->ij', (z[1:]**3 - z[:-1]**3) / 3, self._Q_bar)
+        return np.linalg.inv(np.block([[A, B], [B, D]]))
     
     def calculate_effective_properties(self) -> Dict[str, float]:
-        """Calculate effective properties using composipy"""
-        props = self.laminate.get_effective_properties()
+        """Calculate effective properties from the in-plane laminate compliance"""
+        # From the compliance matrix already computed for the stress analysis
+        S = self._S
+        h = self.total_thickness * 1e-3  # Convert to m
         
         return {
-            'E_x': props['Ex'] / 1e9,  # Convert back to GPa
-            'E_y': props['Ey'] / 1e9,
-            'nu_xy': props['nuxy'],
-            'G_xy': props['Gxy'] / 1e9,
+            'E_x': 1 / (h * S[0, 0]) / 1e9,  # Convert back to GPa
+            'E_y': 1 / (h * S[1, 1]) / 1e9,
+            'nu_xy': -S[0, 1] / S[0, 0],
+            'G_xy': 1 / (h * S[2, 2]) / 1e9,
             'thickness': self.total_thickness,
             'density': self.plies[0].density  # Assuming uniform density
         }
     
     def calculate_stress_strain(self, loads: Dict[str, float]) -> Dict[str, np.ndarray]:
-        """Calculate stress and strain distribution through thickness"""
-        # Convert loads to composipy format
-        N = np.array([loads.get('Nx', 0), loads.get('Ny', 0), loads.get('Nxy', 0)])
-        M = np.array([loads.get('Mx', 0), loads.get('My', 0), loads.get('Mxy', 0)])
+        """
+        Calculate stress and strain distribution through thickness
         
-        # Get stress and strain from composipy
-        stresses, strains = self.laminate.get_stress_strain(N, M)
+        Results for the most recent sets of loads are cached on this layup, so the
+        returned arrays are read-only.
+        """
+        # Dicts are unhashable, so key the cache on the load items
+        key = frozenset(loads.items())
+        cache = self._stress_strain_cache
+        result = cache.get(key)
+        if result is None:
+            result = cache[key] = self._calculate_stress_strain(loads)
+            if len(cache) > _STRESS_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        # A fresh dict each time, so callers cannot swap entries in the cached one
+        return dict(result)
+    
+    def _calculate_stress_strain(self, loads: Dict[str, float]) -> Dict[str, np.ndarray]:
+        """Stress/strain computation for a given set of loads, with read-only results"""
+        N = np.array([[loads.get('Nx', 0), loads.get('Ny', 0), loads.get('Nxy', 0)]])
+        M = np.array([[loads.get('Mx', 0), loads.get('My', 0), loads.get('Mxy', 0)]])
         
-        return {
+        # A single load case is a batch of one
+        batch = self.calculate_stress_strain_batch(N, M)
+        stresses = batch['stresses'][:, :, 0]
+        strains = batch['strains'][:, :, 0]
+        
+        result = {
             'stresses': stresses,  # Through-thickness stress distribution
             'strains': strains,    # Through-thickness strain distribution
             'max_stress': np.max(np.abs(stresses), axis=0),  # Maximum stresses
             'max_strain': np.max(np.abs(strains), axis=0)    # Maximum strains
         }
+        for array in result.values():
+            array.setflags(write=False)
+        return result
+    
+    def calculate_stress_strain_batch(self, N: np.ndarray, M: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Calculate ply stresses and strains for many load cases at once
+        
+        Args:
+            N: In-plane force resultants (Nx, Ny, Nxy) per load case, shape (Nload, 3)
+            M: Moment resultants (Mx, My, Mxy) per load case, shape (Nload, 3)
+        
+        Returns:
+            Dictionary with per-ply 'stresses' and 'strains' of shape (Nply, 3, Nload)
+            and their envelopes over plies and load cases
+        """
+        N = np.atleast_2d(N)
+        M = np.atleast_2d(M)
+        
+        # Mid-plane strains and curvatures, shape (3, Nload)
+        S = self._S
+        epsilon0 = S[:3, :3] @ N.T + S[:3, 3:] @ M.T
+        kappa = S[3:, :3] @ N.T + S[3:, 3:] @ M.T
+        
+        # Global strains and stresses at the mid-plane of every ply
+        z_mid = (self._z[1:] + self._z[:-1]) / 2
+        strains = epsilon0[None, :, :] + z_mid[:, None, None] * kappa[None, :, :]
+        stresses = np.einsum('pij,pjL->piL', self._Q_bar, strains)
+        
+        return {
+            'stresses': stresses,
+            'strains': strains,
+            'max_stress': np.max(np.abs(stresses), axis=(0, 2)),  # Stress envelope
+            'max_strain': np.max(np.abs(strains), axis=(0, 2))    # Strain envelope
+        }
+    
+    def _to_material_axes(self, values: np.ndarray, shear_factor: float = 1.0) -> np.ndarray:
+        """
+        Rotate ply stresses (shear_factor=1) or engineering strains (shear_factor=0.5)
+        from laminate to material axes, shape (N, 3)
+        """
+        x, y, xy = values[:, 0], values[:, 1], values[:, 2] * shear_factor
+        mean = (x + y) / 2
+        diff = (x - y) / 2
+        
+        rotated = np.empty_like(values)
+        rotated[:, 0] = mean + diff*self._c2 + xy*self._s2
+        rotated[:, 1] = mean - diff*self._c2 - xy*self._s2
+        rotated[:, 2] = (-diff*self._s2 + xy*self._c2) / shear_factor
+        return rotated
     
     def calculate_failure(self, loads: Dict[str, float], criterion: str = 'tsai_hill') -> Dict[str, float]:
         """Calculate failure indices using various criteria"""
-        # Get stress distribution
         stress_strain = self.calculate_stress_strain(loads)
-        stresses = stress_strain['stresses']
         
-        # Create LaminateStrength object for failure analysis
-        strength = LaminateStrength(self.materials, stresses)
+        # Ply allowables in material axes
+        Xt, Yt, S12 = self._strength.T
         
-        # Calculate failure indices
+        # Calculate failure indices for all plies at once
         if criterion == 'tsai_hill':
-            failure_indices = strength.tsai_hill()
+            s1, s2, t12 = self._to_material_axes(stress_strain['stresses']).T
+            failure_indices = (s1/Xt)**2 - s1*s2/Xt**2 + (s2/Yt)**2 + (t12/S12)**2
         elif criterion == 'max_stress':
-            failure_indices = strength.max_stress()
+            stresses = self._to_material_axes(stress_strain['stresses'])
+            failure_indices = np.max(np.abs(stresses) / self._strength, axis=1)
         elif criterion == 'max_strain':
-            failure_indices = strength.max_strain()
+            # Strain allowables of a linear-elastic ply
+            strains = self._to_material_axes(stress_strain['strains'], shear_factor=0.5)
+            failure_indices = np.max(np.abs(strains) * self._E / self._strength, axis=1)
         else:
             raise ValueError(f"Unknown failure criterion: {criterion}")
         
         return {
             'max_failure_index': np.max(failure_indices),
             'failure_indices': failure_indices,
+            'governing_ply': int(np.argmax(failure_indices)),
             'failed_plies': np.where(failure_indices >= 1.0)[0].tolist()
         }
 
 def create_symmetric_layup(ply_properties: PlyProperties, orientations: List[float]) -> CompositeAnalysis:
     """Create a symmetric layup from a list of orientations"""
-    plies = []
-    # Add plies for first half
-    for angle in orientations:
-        plies.append(PlyProperties(
-            E11=ply_properties.E11,
-            E22=ply_properties.E22,
-            nu12=ply_properties.nu12,
-            G12=ply_properties.G12,
-            thickness=ply_properties.thickness,
-            orientation=angle,
-            density=ply_properties.density
-        ))
-    # Add plies for second half (mirrored)
-    for angle in reversed(orientations):
-        plies.append(PlyProperties(
-            E11=ply_properties.E11,
-            E22=ply_properties.E22,
-            nu12=ply_properties.nu12,
-            G12=ply_properties.G12,
-            thickness=ply_properties.thickness,
-            orientation=angle,
-            density=ply_properties.density
-        ))
+    # First half followed by its mirror image, sharing the material properties
+    plies = [replace(ply_properties, orientation=angle)
+             for angle in chain(orientations, reversed(orientations))]
     return CompositeAnalysis(plies)
 
 if __name__ == "__main__":
@@ -1,8 +1,25 @@
 import numpy as np
-from dataclasses import dataclass
+from scipy.linalg import LinAlgError, cho_factor, cho_solve
+from dataclasses import dataclass, field
 from typing import List, Tuple
 
-@dataclass
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+# Record layout of one ply (SI units, degrees), for passing a whole layup as one array
+PLY_DTYPE = np.dtype([
+    ('E11', 'f8'),
+    ('E22', 'f8'),
+    ('nu12', 'f8'),
+    ('G12', 'f8'),
+    ('thickness', 'f8'),
+    ('orientation', 'f8')
+])
+
+@dataclass(frozen=True)
 class PlyProperties:
     E11: float  # Longitudinal modulus (GPa)
     E22: float  # Transverse modulus (GPa)
@@ -10,92 +27,400 @@ class PlyProperties:
     G12: float  # In-plane shear modulus (GPa)
     thickness: float  # Ply thickness (mm)
     orientation: float  # Fiber orientation angle (degrees)
+    nu21: float = field(init=False)  # Minor Poisson's ratio
     
     def __post_init__(self):
-        # Convert GPa to Pa for internal calculations
-        self.E11 *= 1e9
-        self.E22 *= 1e9
-        self.G12 *= 1e9
-        # Convert thickness to meters
-        self.thickness *= 1e-3
+        object.__setattr__(self, 'nu21', self.nu12 * self.E22 / self.E11)
+    
+    def in_SI(self) -> Tuple[float, ...]:
+        """Ply properties in SI units (Pa, m), in PLY_DTYPE field order"""
+        return (
+            self.E11 * 1e9,
+            self.E22 * 1e9,
+            self.nu12,
+            self.G12 * 1e9,
+            self.thickness * 1e-3,
+            self.orientation
+        )
+
+# Row/column of the six unique entries of a symmetric 3x3 matrix: 11, 12, 16, 22, 26, 66
+_SYM_ROWS = (0, 0, 0, 1, 1, 2)
+_SYM_COLS = (0, 1, 2, 1, 2, 2)
+
+def _abd_kernel(E11, E22, nu12, G12, theta, w_A, w_B, w_D):
+    """
+    Accumulate A, B and D ply by ply from the per-ply z weights, in one pass
+    
+    Q_bar is never stored: each ply's six unique terms are evaluated from the
+    invariants and added straight into the A, B and D sums.
+    """
+    sums = np.zeros((3, 6))  # Rows: A, B, D
+    Q_bar = np.empty(6)
+    
+    for p in range(theta.shape[0]):
+        denom = 1 - nu12[p] * nu12[p] * E22[p] / E11[p]
+        Q11 = E11[p] / denom
+        Q22 = E22[p] / denom
+        Q12 = nu12[p] * E22[p] / denom
+        Q66 = G12[p]
         
-    @property
-    def nu21(self) -> float:
-        """Calculate minor Poisson's ratio"""
-        return self.nu12 * self.E22 / self.E11
+        U1 = (3*Q11 + 3*Q22 + 2*Q12 + 4*Q66) / 8
+        U2 = (Q11 - Q22) / 2
+        U3 = (Q11 + Q22 - 2*Q12 - 4*Q66) / 8
+        U4 = (Q11 + Q22 + 6*Q12 - 4*Q66) / 8
+        U5 = (Q11 + Q22 - 2*Q12 + 4*Q66) / 8
+        
+        theta_rad = theta[p] * np.pi / 180
+        c2 = np.cos(2 * theta_rad)
+        s2 = np.sin(2 * theta_rad)
+        c4 = np.cos(4 * theta_rad)
+        s4 = np.sin(4 * theta_rad)
+        
+        Q_bar[0] = U1 + U2*c2 + U3*c4
+        Q_bar[1] = U4 - U3*c4
+        Q_bar[2] = 0.5*U2*s2 + U3*s4
+        Q_bar[3] = U1 - U2*c2 + U3*c4
+        Q_bar[4] = 0.5*U2*s2 - U3*s4
+        Q_bar[5] = U5 - U3*c4
+        
+        for m in range(6):
+            sums[0, m] += Q_bar[m] * w_A[p]
+            sums[1, m] += Q_bar[m] * w_B[p]
+            sums[2, m] += Q_bar[m] * w_D[p]
+    
+    # Expand the unique entries into the symmetric matrices
+    A = np.empty((3, 3))
+    B = np.empty((3, 3))
+    D = np.empty((3, 3))
+    for m in range(6):
+        i = _SYM_ROWS[m]
+        j = _SYM_COLS[m]
+        A[i, j] = A[j, i] = sums[0, m]
+        B[i, j] = B[j, i] = sums[1, m]
+        D[i, j] = D[j, i] = sums[2, m]
+    
+    return A, B, D
+
+if _HAS_NUMBA:
+    # Compiled on first call (and cached to disk), so importing this module
+    # does not pay the JIT cost
+    _abd_kernel = njit(cache=True, fastmath=True, boundscheck=False)(_abd_kernel)
+
+def _batch_abd_kernel(E11, E22, nu12, G12, theta, w_A, w_B, w_D):
+    """A, B and D for each row (candidate layup) of theta and the weights, one material"""
+    n_cand, n_ply = theta.shape
+    A = np.empty((n_cand, 3, 3))
+    B = np.empty((n_cand, 3, 3))
+    D = np.empty((n_cand, 3, 3))
+    E11_ply = np.full(n_ply, E11)
+    E22_ply = np.full(n_ply, E22)
+    nu12_ply = np.full(n_ply, nu12)
+    G12_ply = np.full(n_ply, G12)
+    
+    for c in prange(n_cand):
+        A_c, B_c, D_c = _abd_kernel(E11_ply, E22_ply, nu12_ply, G12_ply,
+                                    theta[c], w_A[c], w_B[c], w_D[c])
+        A[c] = A_c
+        B[c] = B_c
+        D[c] = D_c
+    
+    return A, B, D
+
+if _HAS_NUMBA:
+    # Candidates are independent, so they are spread across cores
+    _batch_abd_kernel = njit(cache=True, parallel=True)(_batch_abd_kernel)
+
+def _clt_kernel(E11, E22, nu12, G12, thickness, theta):
+    """
+    Full CLT for one layup: the 6x6 ABD matrix and E_x, E_y, nu_xy, G_xy (SI)
+    
+    Ply interfaces, ABD and the in-plane compliance are all evaluated in one
+    compiled call.
+    """
+    n_ply = thickness.shape[0]
+    z = np.empty(n_ply + 1)
+    z[0] = -thickness.sum() / 2
+    for p in range(n_ply):
+        z[p + 1] = z[p] + thickness[p]
+    w_B = (z[1:]**2 - z[:-1]**2) / 2
+    w_D = (z[1:]**3 - z[:-1]**3) / 3
+    
+    A, B, D = _abd_kernel(E11, E22, nu12, G12, theta, thickness, w_B, w_D)
+    ABD = np.empty((6, 6))
+    ABD[:3, :3] = A
+    ABD[:3, 3:] = B
+    ABD[3:, :3] = B
+    ABD[3:, 3:] = D
+    
+    # Only the in-plane compliance is needed, so solve for those columns rather
+    # than inverting; with B zero (symmetric layup) that is just A's inverse
+    if np.any(B != 0.0):
+        S = np.linalg.solve(ABD, np.eye(6)[:, :3])
+    else:
+        S = np.linalg.solve(A, np.eye(3))
+    h = z[n_ply] - z[0]
+    return ABD, 1 / (h * S[0, 0]), 1 / (h * S[1, 1]), -S[0, 1] / S[0, 0], 1 / (h * S[2, 2])
+
+if _HAS_NUMBA:
+    _clt_kernel = njit(cache=True, fastmath=True)(_clt_kernel)
+
+def _stiffness_invariants(E11, E22, nu12, G12) -> Tuple[np.ndarray, ...]:
+    """Calculate the Tsai-Pagano stiffness invariants U1..U5 from the ply elastic constants"""
+    nu21 = nu12 * E22 / E11
+    denom = 1 - nu12 * nu21
+    Q11 = E11 / denom
+    Q22 = E22 / denom
+    Q12 = nu12 * E22 / denom
+    Q66 = G12
+    
+    U1 = (3*Q11 + 3*Q22 + 2*Q12 + 4*Q66) / 8
+    U2 = (Q11 - Q22) / 2
+    U3 = (Q11 + Q22 - 2*Q12 - 4*Q66) / 8
+    U4 = (Q11 + Q22 + 6*Q12 - 4*Q66) / 8
+    U5 = (Q11 + Q22 - 2*Q12 + 4*Q66) / 8
+    return U1, U2, U3, U4, U5
+
+def _plies_to_records(plies: List[PlyProperties]) -> np.ndarray:
+    """Pack a list of PlyProperties into a PLY_DTYPE structured array"""
+    return np.array([ply.in_SI() for ply in plies], dtype=PLY_DTYPE)
 
 class CompositeLayup:
-    def __init__(self, plies: List[PlyProperties]):
-        self.plies = plies
-        self.total_thickness = sum(ply.thickness for ply in plies)
-        
-    def _get_Q_matrix(self, ply: PlyProperties) -> np.ndarray:
-        """Calculate the reduced stiffness matrix Q for a ply"""
-        Q11 = ply.E11 / (1 - ply.nu12 * ply.nu21)
-        Q22 = ply.E22 / (1 - ply.nu12 * ply.nu21)
-        Q12 = ply.nu12 * ply.E22 / (1 - ply.nu12 * ply.nu21)
-        Q66 = ply.G12
-        
-        return np.array([
-            [Q11, Q12, 0],
-            [Q12, Q22, 0],
-            [0, 0, Q66]
-        ])
-    
-    def _get_T_matrix(self, theta: float) -> np.ndarray:
-        """Calculate the transformation matrix T for a given angle"""
-        theta_rad = np.radians(theta)
-        c = np.cos(theta_rad)
-        s = np.sin(theta_rad)
+    def __init__(self, E11: np.ndarray, E22: np.ndarray, nu12: np.ndarray, G12: np.ndarray,
+                 thickness: np.ndarray, orientation: np.ndarray, dtype=np.float64):
+        """
+        Initialize a layup from per-ply property arrays, bottom ply first
         
-        return np.array([
-            [c**2, s**2, 2*c*s],
-            [s**2, c**2, -2*c*s],
-            [-c*s, c*s, c**2 - s**2]
-        ])
+        Args:
+            E11, E22, G12: Ply moduli (Pa)
+            nu12: Major Poisson's ratios
+            thickness: Ply thicknesses (m)
+            orientation: Fiber orientation angles (degrees)
+            dtype: Precision of the ply arrays and of Q_bar/ABD (np.float32 to halve
+                memory traffic; the compliance solve is always done in float64)
+        """
+        self.dtype = np.dtype(dtype)
+        # Reused buffer for the full 6x6 ABD matrix
+        self._abd66 = np.empty((6, 6))
+        self._set_ply_arrays(E11, E22, nu12, G12, thickness, orientation)
+    
+    @classmethod
+    def from_plies(cls, plies: List[PlyProperties], dtype=np.float64) -> 'CompositeLayup':
+        """Create a layup from a list of PlyProperties"""
+        return cls.from_records(_plies_to_records(plies), dtype=dtype)
+    
+    @classmethod
+    def from_records(cls, records: np.ndarray, dtype=np.float64) -> 'CompositeLayup':
+        """Create a layup from a structured array with dtype PLY_DTYPE"""
+        return cls(**{name: records[name] for name in PLY_DTYPE.names}, dtype=dtype)
+    
+    @property
+    def records(self) -> np.ndarray:
+        """The ply stack as a structured array with dtype PLY_DTYPE"""
+        records = np.empty(len(self._theta), dtype=PLY_DTYPE)
+        records['E11'] = self._E11
+        records['E22'] = self._E22
+        records['nu12'] = self._nu12
+        records['G12'] = self._G12
+        records['thickness'] = self._thickness
+        records['orientation'] = self._theta
+        return records
+    
+    @property
+    def plies(self) -> List[PlyProperties]:
+        return [
+            PlyProperties(
+                E11=E11/1e9,  # PlyProperties holds GPa and mm
+                E22=E22/1e9,
+                nu12=nu12,
+                G12=G12/1e9,
+                thickness=thickness*1000,
+                orientation=orientation
+            )
+            for E11, E22, nu12, G12, thickness, orientation in self.records.tolist()
+        ]
     
-    def _get_Q_bar_matrix(self, ply: PlyProperties) -> np.ndarray:
-        """Calculate the transformed reduced stiffness matrix Q_bar for a ply"""
-        Q = self._get_Q_matrix(ply)
-        T = self._get_T_matrix(ply.orientation)
-        T_inv = np.linalg.inv(T)
+    @plies.setter
+    def plies(self, plies: List[PlyProperties]):
+        records = _plies_to_records(plies)
+        self._set_ply_arrays(*(records[name] for name in PLY_DTYPE.names))
+    
+    def _set_ply_arrays(self, E11, E22, nu12, G12, thickness, orientation):
+        """Store the ply properties as arrays and reset everything derived from them"""
+        # Contiguous copies, so record fields (strided views) are unit-stride here
+        self._E11 = np.ascontiguousarray(E11, dtype=self.dtype)
+        self._E22 = np.ascontiguousarray(E22, dtype=self.dtype)
+        self._nu12 = np.ascontiguousarray(nu12, dtype=self.dtype)
+        self._G12 = np.ascontiguousarray(G12, dtype=self.dtype)
+        self._thickness = np.ascontiguousarray(thickness, dtype=self.dtype)
+        self._theta = np.ascontiguousarray(orientation, dtype=self.dtype)
+        self.total_thickness = float(self._thickness.sum())
+        
+        # Ply interface coordinates from bottom to top surface, and the
+        # through-thickness weights of each ply in A, B and D
+        self._z = np.zeros(len(self._thickness) + 1, dtype=self.dtype)
+        np.cumsum(self._thickness, out=self._z[1:])
+        self._z -= self._z[-1] / 2
+        self._w_A = self._thickness
+        self._w_B = (self._z[1:]**2 - self._z[:-1]**2) / 2
+        self._w_D = (self._z[1:]**3 - self._z[:-1]**3) / 3
+        
+        # The invariants depend only on the material, so a single-material layup needs them once
+        self._invariants = _stiffness_invariants(self._E11, self._E22, self._nu12, self._G12)
+        if all(np.all(U == U[0]) for U in self._invariants):
+            self._invariants = tuple(U[0] for U in self._invariants)
+        
+        # Set by create_symmetric_layup: the stack mirrors about the mid-plane, so B is zero
+        self.is_symmetric = False
+        
+        # Results derived from the plies, filled in on first use
+        self._abd_cache = None
+        self._compliance_cache = None
+        
+    @staticmethod
+    def batch_abd(theta_batch: np.ndarray, thick_batch: np.ndarray, material: PlyProperties,
+                  dtype=np.float64) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Calculate A, B and D for many candidate layups of one material at once
+        
+        Args:
+            theta_batch: Ply angles (degrees), shape (Ncand, Nply), bottom ply first
+            thick_batch: Ply thicknesses (m), broadcastable to theta_batch
+            material: Ply material (its thickness and orientation are not used)
+            dtype: Precision of the calculation. The default float64 runs on the
+                compiled parallel kernel when Numba is available; float32 halves
+                memory traffic on the NumPy path and is ample for ranking candidates
+        
+        Returns:
+            A, B and D stacks, each of shape (Ncand, 3, 3)
+        """
+        theta = np.atleast_2d(np.asarray(theta_batch, dtype=dtype))
+        thick = np.broadcast_to(np.asarray(thick_batch, dtype=dtype), theta.shape)
+        
+        # Ply interface coordinates and through-thickness weights per candidate
+        h = thick.sum(axis=1, keepdims=True)
+        z = np.concatenate((-h / 2, np.cumsum(thick, axis=1) - h / 2), axis=1)
+        # A writable contiguous copy of the (possibly broadcast, read-only) view, so
+        # the compiled kernels are specialised for one array type only
+        w_A = np.require(thick, requirements=['C', 'W'])
+        w_B = (z[:, 1:]**2 - z[:, :-1]**2) / 2
+        w_D = (z[:, 1:]**3 - z[:, :-1]**3) / 3
+        
+        E11, E22, nu12, G12, _, _ = material.in_SI()
+        # The compiled kernels are float64 only
+        if _HAS_NUMBA and theta.dtype == np.float64:
+            return _batch_abd_kernel(E11, E22, nu12, G12, np.require(theta, requirements=['C', 'W']),
+                                     w_A, w_B, w_D)
+        
+        invariants = _stiffness_invariants(E11, E22, nu12, G12)
+        Q_bar = CompositeLayup._Q_bar_from_invariants(invariants, theta.ravel()).reshape(theta.shape + (3, 3))
+        A = np.einsum('cp,cpij->cij', w_A, Q_bar)
+        B = np.einsum('cp,cpij->cij', w_B, Q_bar)
+        D = np.einsum('cp,cpij->cij', w_D, Q_bar)
+        return A, B, D
+    
+    def _get_Q_bar_stack(self, plies: slice = slice(None)) -> np.ndarray:
+        """Calculate the transformed reduced stiffness matrices Q_bar for the selected plies, shape (N, 3, 3)"""
+        if np.ndim(self._invariants[0]) == 0:
+            # Single material: Q_bar only depends on the angle, so evaluate it
+            # once per distinct orientation and gather it for every ply
+            unique_theta, theta_index = np.unique(self._theta[plies], return_inverse=True)
+            Q_bar = self._Q_bar_from_invariants(self._invariants, unique_theta)
+            return Q_bar[theta_index]
+        
+        invariants = tuple(U[plies] for U in self._invariants)
+        return self._Q_bar_from_invariants(invariants, self._theta[plies])
+    
+    @staticmethod
+    def _Q_bar_from_invariants(invariants: Tuple[np.ndarray, ...], theta: np.ndarray) -> np.ndarray:
+        """Evaluate Q_bar from the stiffness invariants at angles theta (degrees), shape (N, 3, 3)"""
+        U1, U2, U3, U4, U5 = invariants
+        theta_rad = np.radians(theta)
+        c2 = np.cos(2 * theta_rad)
+        s2 = np.sin(2 * theta_rad)
+        c4 = np.cos(4 * theta_rad)
+        s4 = np.sin(4 * theta_rad)
         
-        return T_inv @ Q @ T
+        Q_bar = np.empty((len(theta_rad), 3, 3), dtype=theta_rad.dtype)
+        Q_bar[:, 0, 0] = U1 + U2*c2 + U3*c4
+        Q_bar[:, 1, 1] = U1 - U2*c2 + U3*c4
+        Q_bar[:, 0, 1] = U4 - U3*c4
+        Q_bar[:, 2, 2] = U5 - U3*c4
+        Q_bar[:, 0, 2] = 0.5*U2*s2 + U3*s4
+        Q_bar[:, 1, 2] = 0.5*U2*s2 - U3*s4
+        Q_bar[:, 1, 0] = Q_bar[:, 0, 1]
+        Q_bar[:, 2, 0] = Q_bar[:, 0, 2]
+        Q_bar[:, 2, 1] = Q_bar[:, 1, 2]
+        return Q_bar
     
     def calculate_ABD_matrices(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
-        """Calculate the A, B, and D matrices for the laminate"""
-        A = np.zeros((3, 3))
-        B = np.zeros((3, 3))
-        D = np.zeros((3, 3))
-        
-        z_bottom = -self.total_thickness / 2
-        
-        for ply in self.plies:
-            Q_bar = self._get_Q_bar_matrix(ply)
-            z_top = z_bottom + ply.thickness
-            z_mid = (z_top + z_bottom) / 2
-            
-            A += Q_bar * ply.thickness
-            B += Q_bar * (z_top**2 - z_bottom**2) / 2
-            D += Q_bar * (z_top**3 - z_bottom**3) / 3
-            
-            z_bottom = z_top
+        """
+        Calculate the A, B, and D matrices for the laminate
         
+        The matrices are cached with the layup and returned read-only.
+        """
+        if self._abd_cache is None:
+            abd = self._assemble_ABD_matrices()
+            for matrix in abd:
+                matrix.setflags(write=False)
+            self._abd_cache = abd
+        return self._abd_cache
+    
+    def _assemble_ABD_matrices(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Assemble A, B and D from the ply stack"""
+        # The top half of a symmetric layup mirrors the bottom half: A and D are
+        # twice the bottom half's contribution and the B terms cancel exactly
+        plies = slice(0, len(self._theta) // 2) if self.is_symmetric else slice(None)
+        w_A = self._w_A[plies]
+        w_B = self._w_B[plies]
+        w_D = self._w_D[plies]
+        
+        if _HAS_NUMBA and self.dtype == np.float64:
+            A, B, D = _abd_kernel(self._E11[plies], self._E22[plies], self._nu12[plies],
+                                  self._G12[plies], self._theta[plies], w_A, w_B, w_D)
+        else:
+            Q_bar = self._get_Q_bar_stack(plies)
+            A = np.einsum('p,pij->ij', w_A, Q_bar)
+            B = None if self.is_symmetric else np.einsum('p,pij->ij', w_B, Q_bar)
+            D = np.einsum('p,pij->ij', w_D, Q_bar)
+        
+        if self.is_symmetric:
+            return 2 * A, np.zeros((3, 3), dtype=self.dtype), 2 * D
         return A, B, D
     
-    def calculate_effective_properties(self) -> dict:
-        """Calculate the effective engineering properties of the laminate"""
+    def _get_compliance_matrix(self) -> np.ndarray:
+        """Calculate (once) the in-plane columns of the laminate compliance matrix"""
+        if self._compliance_cache is not None:
+            return self._compliance_cache
+        
         A, B, D = self.calculate_ABD_matrices()
-        h = self.total_thickness
+        if self.is_symmetric:
+            # B is zero, so the in-plane compliance is just the inverse of A
+            stiffness = A.astype(np.float64)
+            rhs = np.eye(3)
+        else:
+            # Fill the full ABD matrix in place (float64 whatever the layup dtype)
+            stiffness = self._abd66
+            stiffness[:3, :3] = A
+            stiffness[:3, 3:] = B
+            stiffness[3:, :3] = B
+            stiffness[3:, 3:] = D
+            rhs = np.eye(6)[:, :3]
         
-        # Create the full ABD matrix
-        ABD = np.block([
-            [A, B],
-            [B, D]
-        ])
+        # Only the first three columns of the inverse are needed, so solve for
+        # them rather than inverting. ABD is symmetric positive-definite for
+        # physical plies; fall back to LU if it is not.
+        try:
+            S = cho_solve(cho_factor(stiffness), rhs)
+        except LinAlgError:
+            S = np.linalg.solve(stiffness, rhs)
         
-        # Calculate compliance matrix
-        S = np.linalg.inv(ABD)
+        self._compliance_cache = S
+        return S
+    
+    def calculate_effective_properties(self) -> dict:
+        """Calculate the effective engineering properties of the laminate"""
+        h = self.total_thickness
+        S = self._get_compliance_matrix()
         
         # For unsymmetric laminates, use compliance matrix approach
         # Extract the in-plane compliance terms (S11, S12, S22, S66)
@@ -116,33 +441,53 @@ class CompositeLayup:
             'nu_xy': nu_xy,
             'G_xy': G_xy / 1e9,
             'thickness': self.total_thickness * 1000,  # Convert to mm
-            'density': sum(ply.thickness for ply in self.plies) / self.total_thickness  # Assuming uniform density
+            'density': self._thickness.sum() / self.total_thickness  # Assuming uniform density
         }
 
 def create_symmetric_layup(ply_properties: PlyProperties, orientations: List[float]) -> CompositeLayup:
     """Create a symmetric layup from a list of orientations"""
-    plies = []
-    # Add plies for first half
-    for angle in orientations:
-        plies.append(PlyProperties(
-            E11=ply_properties.E11/1e9,  # Convert back to GPa for input
-            E22=ply_properties.E22/1e9,
-            nu12=ply_properties.nu12,
-            G12=ply_properties.G12/1e9,
-            thickness=ply_properties.thickness*1000,  # Convert back to mm
-            orientation=angle
-        ))
-    # Add plies for second half (mirrored)
-    for angle in reversed(orientations):
-        plies.append(PlyProperties(
-            E11=ply_properties.E11/1e9,
-            E22=ply_properties.E22/1e9,
-            nu12=ply_properties.nu12,
-            G12=ply_properties.G12/1e9,
-            thickness=ply_properties.thickness*1000,
-            orientation=angle
-        ))
-    return CompositeLayup(plies)
+    # First half followed by its mirror image
+    orientations = np.asarray(orientations, dtype=float)
+    theta = np.concatenate([orientations, orientations[::-1]])
+    
+    E11, E22, nu12, G12, thickness, _ = ply_properties.in_SI()
+    layup = CompositeLayup(
+        E11=np.full_like(theta, E11),
+        E22=np.full_like(theta, E22),
+        nu12=np.full_like(theta, nu12),
+        G12=np.full_like(theta, G12),
+        thickness=np.full_like(theta, thickness),
+        orientation=theta
+    )
+    layup.is_symmetric = True
+    return layup
+
+def clt_effective_properties(E11: np.ndarray, E22: np.ndarray, nu12: np.ndarray, G12: np.ndarray,
+                             thickness: np.ndarray, orientation: np.ndarray) -> Tuple[np.ndarray, dict]:
+    """
+    Calculate the ABD matrix and effective properties straight from per-ply arrays
+    
+    Args:
+        E11, E22, G12: Ply moduli (Pa)
+        nu12: Major Poisson's ratios
+        thickness: Ply thicknesses (m)
+        orientation: Fiber orientation angles (degrees)
+    
+    Returns:
+        The 6x6 ABD matrix and a dictionary of effective properties in the units
+        of CompositeLayup.calculate_effective_properties (without density)
+    """
+    # Writable contiguous float64 arrays, so the compiled kernel is specialised once
+    arrays = (np.require(a, dtype=np.float64, requirements=['C', 'W'])
+              for a in (E11, E22, nu12, G12, thickness, orientation))
+    ABD, E_x, E_y, nu_xy, G_xy = _clt_kernel(*arrays)
+    return ABD, {
+        'E_x': E_x / 1e9,  # Convert back to GPa
+        'E_y': E_y / 1e9,
+        'nu_xy': nu_xy,
+        'G_xy': G_xy / 1e9,
+        'thickness': float(np.sum(thickness)) * 1000  # Convert to mm
+    }
 
 if __name__ == "__main__":
     # Example ply properties (Carbon Fiber)
@@ -1,8 +1,15 @@
 import numpy as np
+from scipy.linalg import LinAlgError, cho_factor, cho_solve, lu_factor, lu_solve
 from dataclasses import dataclass
 from typing import List, Tuple, Dict, Optional
 from enum import Enum
 
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
 class MaterialType(Enum):
     """Predefined material types for quick reference"""
     CARBON_T300 = {
@@ -59,36 +66,43 @@ class MaterialType(Enum):
 
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PlyProperties:
-    """Properties for a single ply"""
-    E11: float  # Longitudinal modulus (GPa)
-    E22: float  # Transverse modulus (GPa)
+    """Properties for a single ply, in SI units (use from_user_units for GPa and mm)"""
+    E11: float  # Longitudinal modulus (Pa)
+    E22: float  # Transverse modulus (Pa)
     nu12: float  # Major Poisson's ratio
-    G12: float  # In-plane shear modulus (GPa)
-    thickness: float  # Ply thickness (mm)
+    G12: float  # In-plane shear modulus (Pa)
+    thickness: float  # Ply thickness (m)
     orientation: float  # Fiber orientation angle (degrees)
     density: float  # Density (kg/m³)
     name: str = ""  # Optional name/identifier for the ply
     
-    def __post_init__(self):
-        # Convert GPa to Pa for internal calculations
-        self.E11 *= 1e9
-        self.E22 *= 1e9
-        self.G12 *= 1e9
-        # Convert thickness to meters
-        self.thickness *= 1e-3
-        
     @property
     def nu21(self) -> float:
-        """Calculate minor Poisson's ratio"""
+        """Minor Poisson's ratio"""
         return self.nu12 * self.E22 / self.E11
     
+    @classmethod
+    def from_user_units(cls, E11: float, E22: float, nu12: float, G12: float, thickness: float,
+                        orientation: float, density: float, name: str = "") -> 'PlyProperties':
+        """Create ply properties from moduli in GPa and thickness in mm"""
+        return cls(
+            E11=E11 * 1e9,
+            E22=E22 * 1e9,
+            nu12=nu12,
+            G12=G12 * 1e9,
+            thickness=thickness * 1e-3,
+            orientation=orientation,
+            density=density,
+            name=name
+        )
+    
     @classmethod
     def from_material_type(cls, material_type: MaterialType, thickness: float, orientation: float, name: str = "") -> 'PlyProperties':
         """Create ply properties from a predefined material type"""
         props = material_type.value
-        return cls(
+        return cls.from_user_units(
             E11=props['E11'],
             E22=props['E22'],
             nu12=props['nu12'],
@@ -99,6 +113,218 @@ class PlyProperties:
             name=name
         )
 
+def _q_bar_stack(E11, E22, nu12, G12, theta_deg, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Transformed reduced stiffness Q_bar of each ply, shape (n, 3, 3)
+    
+    Uses the closed-form terms in m = cos(theta) and n = sin(theta) rather than
+    forming T^T Q T. Written into out when given.
+    """
+    E11, E22, nu12, G12, theta_deg = np.broadcast_arrays(*np.atleast_1d(E11, E22, nu12, G12, theta_deg))
+    denom = 1 - nu12 * nu12 * E22 / E11
+    Q11 = E11 / denom
+    Q22 = E22 / denom
+    Q12 = nu12 * E22 / denom
+    Q66 = G12
+    
+    theta_rad = np.radians(theta_deg)
+    m = np.cos(theta_rad)
+    n = np.sin(theta_rad)
+    m2 = m * m
+    n2 = n * n
+    m4 = m2 * m2
+    n4 = n2 * n2
+    m2n2 = m2 * n2
+    
+    Q_bar = np.empty((len(theta_deg), 3, 3)) if out is None else out
+    Q_bar[:, 0, 0] = Q11 * m4 + 2 * (Q12 + 2 * Q66) * m2n2 + Q22 * n4
+    Q_bar[:, 0, 1] = Q_bar[:, 1, 0] = (Q11 + Q22 - 4 * Q66) * m2n2 + Q12 * (m4 + n4)
+    Q_bar[:, 1, 1] = Q11 * n4 + 2 * (Q12 + 2 * Q66) * m2n2 + Q22 * m4
+    Q_bar[:, 0, 2] = Q_bar[:, 2, 0] = (Q11 - Q12 - 2 * Q66) * m2 * m * n + (Q12 - Q22 + 2 * Q66) * m * n2 * n
+    Q_bar[:, 1, 2] = Q_bar[:, 2, 1] = (Q11 - Q12 - 2 * Q66) * m * n2 * n + (Q12 - Q22 + 2 * Q66) * m2 * m * n
+    Q_bar[:, 2, 2] = (Q11 + Q22 - 2 * Q12 - 2 * Q66) * m2n2 + Q66 * (m4 + n4)
+    return Q_bar
+
+def _fill_Q_T(E11, E22, nu12, G12, theta, Q, T):
+    """Write one ply's reduced stiffness Q and strain transformation T into the given 3x3 arrays"""
+    denom = 1 - nu12 * nu12 * E22 / E11
+    Q[0, 0] = E11 / denom
+    Q[1, 1] = E22 / denom
+    Q[0, 1] = Q[1, 0] = nu12 * E22 / denom
+    Q[0, 2] = Q[2, 0] = Q[1, 2] = Q[2, 1] = 0.0
+    Q[2, 2] = G12
+    
+    theta_rad = theta * np.pi / 180
+    c = np.cos(theta_rad)
+    s = np.sin(theta_rad)
+    T[0, 0] = T[1, 1] = c * c
+    T[0, 1] = T[1, 0] = s * s
+    T[0, 2] = c * s
+    T[1, 2] = -c * s
+    T[2, 0] = -2 * c * s
+    T[2, 1] = 2 * c * s
+    T[2, 2] = c * c - s * s
+
+def _assemble_ABD_core(E11, E22, nu12, G12, theta, dz, dz2, dz3, A, B, D, Q_bar):
+    """
+    Fill A, B, D and the Q_bar stack from the per-ply arrays in a single pass
+    
+    dz, dz2 and dz3 are each ply's through-thickness weights in A, B and D. Each
+    ply's Q_bar comes from the closed-form expansion of T^T Q T, so no Q or T
+    matrices are formed.
+    """
+    n = theta.shape[0]
+    A.fill(0.0)
+    B.fill(0.0)
+    D.fill(0.0)
+    
+    for p in range(n):
+        denom = 1 - nu12[p] * nu12[p] * E22[p] / E11[p]
+        Q11 = E11[p] / denom
+        Q22 = E22[p] / denom
+        Q12 = nu12[p] * E22[p] / denom
+        Q66 = G12[p]
+        
+        theta_rad = theta[p] * np.pi / 180
+        m = np.cos(theta_rad)
+        s = np.sin(theta_rad)
+        m2 = m * m
+        s2 = s * s
+        m2s2 = m2 * s2
+        m4s4 = m2 * m2 + s2 * s2
+        
+        Q_bar[p, 0, 0] = Q11 * m2 * m2 + 2 * (Q12 + 2 * Q66) * m2s2 + Q22 * s2 * s2
+        Q_bar[p, 0, 1] = (Q11 + Q22 - 4 * Q66) * m2s2 + Q12 * m4s4
+        Q_bar[p, 1, 1] = Q11 * s2 * s2 + 2 * (Q12 + 2 * Q66) * m2s2 + Q22 * m2 * m2
+        Q_bar[p, 0, 2] = (Q11 - Q12 - 2 * Q66) * m2 * m * s + (Q12 - Q22 + 2 * Q66) * m * s2 * s
+        Q_bar[p, 1, 2] = (Q11 - Q12 - 2 * Q66) * m * s2 * s + (Q12 - Q22 + 2 * Q66) * m2 * m * s
+        Q_bar[p, 2, 2] = (Q11 + Q22 - 2 * Q12 - 2 * Q66) * m2s2 + Q66 * m4s4
+        Q_bar[p, 1, 0] = Q_bar[p, 0, 1]
+        Q_bar[p, 2, 0] = Q_bar[p, 0, 2]
+        Q_bar[p, 2, 1] = Q_bar[p, 1, 2]
+        
+        for i in range(3):
+            for j in range(3):
+                A[i, j] += Q_bar[p, i, j] * dz[p]
+                B[i, j] += Q_bar[p, i, j] * dz2[p]
+                D[i, j] += Q_bar[p, i, j] * dz3[p]
+
+def _ply_stresses_core(E11, E22, nu12, G12, theta, z_mid, epsilon0, kappa):
+    """
+    Mid-plane strains and stresses of every ply for k load cases
+    
+    Args:
+        z_mid: Ply mid-plane coordinates
+        epsilon0, kappa: Mid-plane strains and curvatures, shape (3, k)
+    
+    Returns:
+        Tuple of (strain_global, strain_material, stress_material, stress_global),
+        each of shape (n, 3, k)
+    """
+    n = theta.shape[0]
+    k = epsilon0.shape[1]
+    eps_g = np.empty((n, 3, k))
+    eps_m = np.empty((n, 3, k))
+    sig_m = np.empty((n, 3, k))
+    sig_g = np.empty((n, 3, k))
+    Q = np.empty((3, 3))
+    T = np.empty((3, 3))
+    
+    for p in range(n):
+        _fill_Q_T(E11[p], E22[p], nu12[p], G12[p], theta[p], Q, T)
+        
+        for c in range(k):
+            for i in range(3):
+                eps_g[p, i, c] = epsilon0[i, c] + z_mid[p] * kappa[i, c]
+            for i in range(3):
+                eps_m[p, i, c] = T[i, 0] * eps_g[p, 0, c] + T[i, 1] * eps_g[p, 1, c] + T[i, 2] * eps_g[p, 2, c]
+            for i in range(3):
+                sig_m[p, i, c] = Q[i, 0] * eps_m[p, 0, c] + Q[i, 1] * eps_m[p, 1, c] + Q[i, 2] * eps_m[p, 2, c]
+            # Stresses rotate back to global axes with the transpose of T
+            for i in range(3):
+                sig_g[p, i, c] = T[0, i] * sig_m[p, 0, c] + T[1, i] * sig_m[p, 1, c] + T[2, i] * sig_m[p, 2, c]
+    
+    return eps_g, eps_m, sig_m, sig_g
+
+if _HAS_NUMBA:
+    _fill_Q_T = njit(cache=True, fastmath=True)(_fill_Q_T)
+    _assemble_ABD_core = njit(cache=True, fastmath=True)(_assemble_ABD_core)
+    _ply_stresses_core = njit(cache=True, fastmath=True)(_ply_stresses_core)
+
+def _batch_layup_kernel(E11, E22, nu12, G12, theta, dz, dz2, dz3, z_mid, loads):
+    """
+    In-plane compliance terms and ply stresses of many layups, one per row of the ply arrays
+    
+    Returns:
+        Tuple of (E_x, E_y, nu_xy, G_xy per layup, shape (L, 4), in Pa),
+        material stresses and global stresses, each of shape (L, n, 3, k)
+    """
+    n_layup, n_ply = theta.shape
+    k = loads.shape[1]
+    props = np.empty((n_layup, 4))
+    sig_m = np.empty((n_layup, n_ply, 3, k))
+    sig_g = np.empty((n_layup, n_ply, 3, k))
+    
+    for l in prange(n_layup):
+        A = np.empty((3, 3))
+        B = np.empty((3, 3))
+        D = np.empty((3, 3))
+        _assemble_ABD_core(E11[l], E22[l], nu12[l], G12[l], theta[l], dz[l], dz2[l], dz3[l],
+                           A, B, D, np.empty((n_ply, 3, 3)))
+        ABD = np.empty((6, 6))
+        ABD[:3, :3] = A
+        ABD[:3, 3:] = B
+        ABD[3:, :3] = B
+        ABD[3:, 3:] = D
+        # One solve for the three in-plane compliance columns and the load
+        # columns together, rather than inverting ABD
+        rhs = np.zeros((6, 3 + k))
+        for i in range(3):
+            rhs[i, i] = 1.0
+        rhs[:, 3:] = loads
+        X = np.linalg.solve(ABD, rhs)
+        
+        h = dz[l].sum()
+        props[l, 0] = 1 / (h * X[0, 0])
+        props[l, 1] = 1 / (h * X[1, 1])
+        props[l, 2] = -X[0, 1] / X[0, 0]
+        props[l, 3] = 1 / (h * X[2, 2])
+        
+        strains_curvatures = X[:, 3:]
+        _, _, sig_m[l], sig_g[l] = _ply_stresses_core(
+            E11[l], E22[l], nu12[l], G12[l], theta[l], z_mid[l],
+            np.ascontiguousarray(strains_curvatures[:3]), np.ascontiguousarray(strains_curvatures[3:])
+        )
+    
+    return props, sig_m, sig_g
+
+if _HAS_NUMBA:
+    _batch_layup_kernel = njit(cache=True, parallel=True)(_batch_layup_kernel)
+
+def _factor_symmetric(M: np.ndarray) -> tuple:
+    """
+    Factor a symmetric matrix for repeated solves, tagged with the method used
+    
+    Cholesky for the usual positive-definite case; LU if that fails.
+    """
+    try:
+        return 'chol', cho_factor(M, lower=True, check_finite=False)
+    except LinAlgError:
+        return 'lu', lu_factor(M, check_finite=False)
+
+def _solve_factored(factor: tuple, b: np.ndarray) -> np.ndarray:
+    """Solve with a factorization from _factor_symmetric"""
+    kind, f = factor
+    if kind == 'chol':
+        return cho_solve(f, b, check_finite=False)
+    return lu_solve(f, b, check_finite=False)
+
+def _load_vector(loads) -> np.ndarray:
+    """Load dict (Nx, Ny, Nxy, Mx, My, Mxy) or array as a (6,) or (6, k) float array"""
+    if isinstance(loads, dict):
+        return np.array([loads.get(key, 0) for key in ('Nx', 'Ny', 'Nxy', 'Mx', 'My', 'Mxy')], dtype=float)
+    return np.asarray(loads, dtype=float)
+
 class CustomLayup:
     def __init__(self, plies: List[PlyProperties]):
         """
@@ -108,87 +334,252 @@ class CustomLayup:
             plies: List of PlyProperties objects, each defining a layer
         """
         self.plies = plies
-        self.total_thickness = sum(ply.thickness for ply in plies)
+    
+    @property
+    def plies(self) -> List[PlyProperties]:
+        """The plies of the layup, bottom ply first"""
+        if self._plies is None:
+            # Layup was built from arrays; create the plies on first access
+            self._plies = [
+                PlyProperties(E11=E11, E22=E22, nu12=nu12, G12=G12,
+                              thickness=t, orientation=theta, density=density, name=name)
+                for E11, E22, nu12, G12, t, theta, density, name in zip(
+                    self._E11.tolist(), self._E22.tolist(), self._nu12.tolist(), self._G12.tolist(),
+                    self._t.tolist(), self._theta.tolist(), self._density.tolist(), self._names)
+            ]
+        return self._plies
+    
+    @plies.setter
+    def plies(self, plies: List[PlyProperties]):
+        n = len(plies)
+        self._set_ply_arrays(
+            E11=np.fromiter((ply.E11 for ply in plies), dtype=np.float64, count=n),
+            E22=np.fromiter((ply.E22 for ply in plies), dtype=np.float64, count=n),
+            nu12=np.fromiter((ply.nu12 for ply in plies), dtype=np.float64, count=n),
+            G12=np.fromiter((ply.G12 for ply in plies), dtype=np.float64, count=n),
+            thickness=np.fromiter((ply.thickness for ply in plies), dtype=np.float64, count=n),
+            orientation=np.fromiter((ply.orientation for ply in plies), dtype=np.float64, count=n),
+            density=np.fromiter((ply.density for ply in plies), dtype=np.float64, count=n),
+            names=[ply.name for ply in plies]
+        )
+        self._plies = plies
+    
+    def _set_ply_arrays(self, E11: np.ndarray, E22: np.ndarray, nu12: np.ndarray, G12: np.ndarray,
+                        thickness: np.ndarray, orientation: np.ndarray, density: np.ndarray,
+                        names: List[str]):
+        """Store the per-ply property arrays (SI units) and everything derived from them"""
+        n = len(thickness)
+        self._plies = None
+        self._names = names
+        self._E11 = E11
+        self._E22 = E22
+        self._nu12 = nu12
+        self._G12 = G12
+        self._theta = orientation
+        self._t = thickness
+        self._density = density
+        self._nu21 = self._nu12 * self._E22 / self._E11
         self._validate_layup()
+        self.total_thickness = float(self._t.sum())
+        
+        # Ply interface coordinates from bottom to top surface, each ply's
+        # mid-plane, and its through-thickness weights in A, B and D
+        h = self.total_thickness
+        z_edges = np.empty(n + 1)
+        z_edges[0] = -h / 2
+        np.cumsum(self._t, out=z_edges[1:])
+        z_edges[1:] -= h / 2
+        self._z_mid = 0.5 * (z_edges[:-1] + z_edges[1:])
+        self._dz = self._t
+        self._dz2 = 0.5 * (z_edges[1:]**2 - z_edges[:-1]**2)
+        self._dz3 = (z_edges[1:]**3 - z_edges[:-1]**3) / 3
+        
+        self._B_is_zero = self._is_mid_plane_symmetric()
+        
+        # Scratch buffers reused by every calculation on this set of plies
+        self._A = np.empty((3, 3))
+        self._B = np.empty((3, 3))
+        self._D = np.empty((3, 3))
+        self._ABD_buf = np.empty((6, 6))
+        self._Q_bar_buf = np.empty((n, 3, 3))
+        self._Q_buf = np.zeros((n, 3, 3))
+        self._T_buf = np.empty((n, 3, 3))
+        
+        # Factored ABD matrix, rebuilt whenever the plies change
+        self._abd_cache = None
+    
+    def _is_mid_plane_symmetric(self) -> bool:
+        """
+        Whether the layup mirrors about its mid-plane, in which case B = 0 and the
+        in-plane and bending problems can be solved separately
+        """
+        return (
+            all(np.array_equal(x, x[::-1]) for x in (self._E11, self._E22, self._nu12, self._G12, self._t))
+            and np.array_equal(self._theta % 180, self._theta[::-1] % 180)
+        )
     
     def _validate_layup(self):
         """Validate the layup configuration"""
-        if not self.plies:
+        if self._t.size == 0:
             raise ValueError("Layup must contain at least one ply")
-        if any(ply.thickness <= 0 for ply in self.plies):
+        if np.any(self._t <= 0):
             raise ValueError("All ply thicknesses must be positive")
     
-    def _get_Q_matrix(self, ply: PlyProperties) -> np.ndarray:
-        """Calculate the reduced stiffness matrix Q for a ply"""
-        Q11 = ply.E11 / (1 - ply.nu12 * ply.nu21)
-        Q22 = ply.E22 / (1 - ply.nu12 * ply.nu21)
-        Q12 = ply.nu12 * ply.E22 / (1 - ply.nu12 * ply.nu21)
-        Q66 = ply.G12
-        
-        return np.array([
-            [Q11, Q12, 0],
-            [Q12, Q22, 0],
-            [0, 0, Q66]
-        ])
-    
-    def _get_T_matrix(self, theta: float) -> np.ndarray:
-        """Calculate the transformation matrix T for a given angle"""
-        theta_rad = np.radians(theta)
+    def _build_Q_stack(self) -> np.ndarray:
+        """Reduced stiffness matrices Q of all plies, shape (n, 3, 3)"""
+        denom = 1 - self._nu12 * self._nu21
+        
+        Q = self._Q_buf
+        Q[:, 0, 0] = self._E11 / denom
+        Q[:, 1, 1] = self._E22 / denom
+        Q[:, 0, 1] = Q[:, 1, 0] = self._nu12 * self._E22 / denom
+        Q[:, 2, 2] = self._G12
+        return Q
+    
+    def _build_T_stack(self) -> np.ndarray:
+        """
+        Strain transformation matrices of all plies, shape (n, 3, 3)
+        
+        Maps global engineering strains to material axes; its transpose maps
+        material stresses back to global axes.
+        """
+        theta_rad = np.radians(self._theta)
         c = np.cos(theta_rad)
         s = np.sin(theta_rad)
         
-        return np.array([
-            [c**2, s**2, 2*c*s],
-            [s**2, c**2, -2*c*s],
-            [-c*s, c*s, c**2 - s**2]
-        ])
+        T = self._T_buf
+        T[:, 0, 0] = T[:, 1, 1] = c**2
+        T[:, 0, 1] = T[:, 1, 0] = s**2
+        T[:, 0, 2] = c*s
+        T[:, 1, 2] = -c*s
+        T[:, 2, 0] = -2*c*s
+        T[:, 2, 1] = 2*c*s
+        T[:, 2, 2] = c**2 - s**2
+        return T
+    
+    def calculate_ABD_matrices(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Calculate the A, B, and D matrices for the laminate
+        
+        Returns copies: the cached matrices are scratch buffers that warm_ABD_update
+        modifies in place.
+        """
+        _, A, B, D, _ = self._get_ABD_factor()
+        return A.copy(), B.copy(), D.copy()
     
-    def _get_Q_bar_matrix(self, ply: PlyProperties) -> np.ndarray:
-        """Calculate the transformed reduced stiffness matrix Q_bar for a ply"""
-        Q = self._get_Q_matrix(ply)
-        T = self._get_T_matrix(ply.orientation)
-        T_inv = np.linalg.inv(T)
+    def _get_ABD_factor(self) -> Tuple[tuple, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Assemble and factor the ABD matrix, reusing the result until the plies change
         
-        return T_inv @ Q @ T
+        Returns:
+            Tuple of (factorization, A, B, D, Q_bar stack); for a symmetric layup
+            the factorization is the pair (factors of A, factors of D)
+        """
+        if self._abd_cache is None:
+            self._abd_cache = self._assemble_ABD()
+        return self._abd_cache
     
-    def calculate_ABD_matrices(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
-        """Calculate the A, B, and D matrices for the laminate"""
-        A = np.zeros((3, 3))
-        B = np.zeros((3, 3))
-        D = np.zeros((3, 3))
+    def _assemble_ABD(self) -> Tuple[tuple, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Build the Q_bar stack, the A, B and D matrices and the factors of ABD"""
+        A, B, D, Q_bar = self._A, self._B, self._D, self._Q_bar_buf
+        if _HAS_NUMBA:
+            _assemble_ABD_core(
+                self._E11, self._E22, self._nu12, self._G12, self._theta, self._dz, self._dz2, self._dz3,
+                A, B, D, Q_bar
+            )
+        else:
+            _q_bar_stack(self._E11, self._E22, self._nu12, self._G12, self._theta, out=Q_bar)
+            np.einsum('n,nij->ij', self._dz, Q_bar, out=A)
+            if not self._B_is_zero:
+                np.einsum('n,nij->ij', self._dz2, Q_bar, out=B)
+            np.einsum('n,nij->ij', self._dz3, Q_bar, out=D)
         
-        z_bottom = -self.total_thickness / 2
+        if self._B_is_zero:
+            B.fill(0)
+        return self._factor_ABD(A, B, D), A, B, D, Q_bar
+    
+    def _factor_ABD(self, A: np.ndarray, B: np.ndarray, D: np.ndarray) -> tuple:
+        """Factors of ABD, or of A and D separately when B = 0"""
+        if self._B_is_zero:
+            return _factor_symmetric(A), _factor_symmetric(D)
         
-        for ply in self.plies:
-            Q_bar = self._get_Q_bar_matrix(ply)
-            z_top = z_bottom + ply.thickness
-            z_mid = (z_top + z_bottom) / 2
-            
-            A += Q_bar * ply.thickness
-            B += Q_bar * (z_top**2 - z_bottom**2) / 2
-            D += Q_bar * (z_top**3 - z_bottom**3) / 3
-            
-            z_bottom = z_top
+        # Fill the full ABD matrix in place; the factorization works on a copy
+        ABD = self._ABD_buf
+        ABD[:3, :3] = A
+        ABD[:3, 3:] = B
+        ABD[3:, :3] = B
+        ABD[3:, 3:] = D
+        return _factor_symmetric(ABD)
+    
+    def warm_ABD_update(self, ply_idx: int, new_props: PlyProperties):
+        """
+        Replace one ply, updating the cached ABD matrices by its change in Q_bar
+        
+        Only the replaced ply's contribution is recomputed, so an optimizer that
+        mutates one ply at a time avoids rebuilding the whole layup. A change of
+        thickness moves every ply, so it falls back to a full rebuild.
+        
+        Args:
+            ply_idx: Index of the ply to replace, bottom ply first
+            new_props: Properties of the new ply
+        """
+        if new_props.thickness != self._t[ply_idx] or self._abd_cache is None:
+            plies = list(self.plies)
+            plies[ply_idx] = new_props
+            self.plies = plies
+            return
+        
+        _, A, B, D, Q_bar = self._abd_cache
+        Q_bar_new = _q_bar_stack(new_props.E11, new_props.E22, new_props.nu12, new_props.G12,
+                                 new_props.orientation)[0]
+        delta = Q_bar_new - Q_bar[ply_idx]
         
-        return A, B, D
+        # Update the ply arrays in place
+        self._E11[ply_idx] = new_props.E11
+        self._E22[ply_idx] = new_props.E22
+        self._nu12[ply_idx] = new_props.nu12
+        self._G12[ply_idx] = new_props.G12
+        self._theta[ply_idx] = new_props.orientation
+        self._density[ply_idx] = new_props.density
+        self._nu21[ply_idx] = new_props.nu21
+        self._names[ply_idx] = new_props.name
+        self._plies = None
+        self._B_is_zero = self._is_mid_plane_symmetric()
+        
+        Q_bar[ply_idx] = Q_bar_new
+        A += delta * self._dz[ply_idx]
+        if self._B_is_zero:
+            B.fill(0)
+        else:
+            B += delta * self._dz2[ply_idx]
+        D += delta * self._dz3[ply_idx]
+        self._abd_cache = (self._factor_ABD(A, B, D), A, B, D, Q_bar)
+    
+    def _solve_ABD(self, load_vector: np.ndarray) -> np.ndarray:
+        """Mid-plane strains and curvatures for a (6,) or (6, k) load vector"""
+        factor = self._get_ABD_factor()[0]
+        if self._B_is_zero:
+            factor_A, factor_D = factor
+            return np.concatenate((_solve_factored(factor_A, load_vector[:3]),
+                                   _solve_factored(factor_D, load_vector[3:])))
+        return _solve_factored(factor, load_vector)
     
     def calculate_effective_properties(self) -> dict:
         """Calculate the effective engineering properties of the laminate"""
-        A, B, D = self.calculate_ABD_matrices()
+        factor = self._get_ABD_factor()[0]
         h = self.total_thickness
         
-        # Create the full ABD matrix
-        ABD = np.block([
-            [A, B],
-            [B, D]
-        ])
-        
-        # Calculate compliance matrix
-        S = np.linalg.inv(ABD)
+        # Only the in-plane block of the compliance matrix is needed: solve for its
+        # first three columns rather than inverting ABD. With B = 0 it is just the
+        # inverse of A
+        if self._B_is_zero:
+            S = _solve_factored(factor[0], np.eye(3))
+        else:
+            S = _solve_factored(factor, np.eye(6, 3))
         
         # Extract the in-plane compliance terms
         S11 = S[0,0]
-        S12 = S[0,1]
+        S12 = S[1,0]
         S22 = S[1,1]
         S66 = S[2,2]
         
@@ -199,7 +590,7 @@ class CustomLayup:
         G_xy = 1 / (h * S66)
         
         # Calculate average density
-        avg_density = sum(ply.density * ply.thickness for ply in self.plies) / self.total_thickness
+        avg_density = float(self._density @ self._t) / self.total_thickness
         
         return {
             'E_x': E_x / 1e9,  # Convert back to GPa
@@ -211,65 +602,136 @@ class CustomLayup:
             'mass_per_area': avg_density * self.total_thickness  # kg/m²
         }
     
-    def get_ply_stresses(self, loads: Dict[str, float]) -> List[Dict[str, np.ndarray]]:
+    def get_ply_stresses_batch(self, loads_matrix: np.ndarray) -> Dict[str, np.ndarray]:
         """
-        Calculate stresses in each ply for given loads
+        Calculate ply strains and stresses for many load cases at once
         
         Args:
-            loads: Dictionary of loads (Nx, Ny, Nxy, Mx, My, Mxy)
+            loads_matrix: Array of shape (k, 6), one load case (Nx, Ny, Nxy, Mx, My, Mxy) per row
         
         Returns:
-            List of dictionaries containing stresses for each ply
+            Dictionary with 'z_location' (mm) of shape (n,), and 'strain_global',
+            'strain_material', 'stress_global' and 'stress_material' (MPa) of
+            shape (k, n, 3)
         """
-        A, B, D = self.calculate_ABD_matrices()
-        ABD = np.block([[A, B], [B, D]])
-        
-        # Create load vector
-        N = np.array([loads.get('Nx', 0), loads.get('Ny', 0), loads.get('Nxy', 0)])
-        M = np.array([loads.get('Mx', 0), loads.get('My', 0), loads.get('Mxy', 0)])
-        load_vector = np.concatenate([N, M])
-        
-        # Calculate mid-plane strains and curvatures
-        strains_curvatures = np.linalg.solve(ABD, load_vector)
-        epsilon0 = strains_curvatures[:3]
-        kappa = strains_curvatures[3:]
-        
-        # Calculate stresses in each ply
-        z_bottom = -self.total_thickness / 2
-        ply_stresses = []
-        
-        for ply in self.plies:
-            z_top = z_bottom + ply.thickness
-            z_mid = (z_top + z_bottom) / 2
-            
-            # Calculate strain at mid-plane of ply
-            epsilon = epsilon0 + z_mid * kappa
-            
-            # Transform strain to material coordinates
-            T = self._get_T_matrix(ply.orientation)
-            epsilon_material = T @ epsilon
-            
-            # Calculate stress in material coordinates
-            Q = self._get_Q_matrix(ply)
-            sigma_material = Q @ epsilon_material
-            
-            # Transform stress back to global coordinates
-            T_inv = np.linalg.inv(T)
-            sigma_global = T_inv @ sigma_material
-            
-            ply_stresses.append({
-                'ply_name': ply.name or f"Ply {len(ply_stresses) + 1}",
-                'z_location': z_mid * 1000,  # Convert to mm
-                'strain_material': epsilon_material,
-                'strain_global': epsilon,
-                'stress_material': sigma_material / 1e6,  # Convert to MPa
-                'stress_global': sigma_global / 1e6
-            })
+        loads_matrix = np.atleast_2d(np.asarray(loads_matrix, dtype=float))
+        
+        # Mid-plane strains and curvatures of every load case, reusing the ABD factorization
+        strains_curvatures = self._solve_ABD(loads_matrix.T).T
+        epsilon0 = strains_curvatures[:, :3]
+        kappa = strains_curvatures[:, 3:]
+        
+        z_mid = self._z_mid
+        if _HAS_NUMBA:
+            # The compiled core works on (3, k) columns and returns (n, 3, k)
+            epsilon, epsilon_material, sigma_material, sigma_global = (
+                x.transpose(2, 0, 1) for x in _ply_stresses_core(
+                    self._E11, self._E22, self._nu12, self._G12, self._theta, z_mid,
+                    np.ascontiguousarray(epsilon0.T), np.ascontiguousarray(kappa.T)
+                )
+            )
+        else:
+            # Global strain at the mid-plane of every ply, shape (k, n, 3)
+            epsilon = epsilon0[:, None, :] + z_mid[None, :, None] * kappa[:, None, :]
             
-            z_bottom = z_top
+            # Transform strains to material coordinates, apply Q, and rotate the
+            # stresses back to global coordinates with the transpose of T
+            T = self._build_T_stack()
+            Q = self._build_Q_stack()
+            epsilon_material = np.einsum('nij,knj->kni', T, epsilon)
+            sigma_material = np.einsum('nij,knj->kni', Q, epsilon_material)
+            sigma_global = np.einsum('nji,knj->kni', T, sigma_material)
+        
+        return {
+            'z_location': z_mid * 1000,  # Convert to mm
+            'strain_global': epsilon,
+            'strain_material': epsilon_material,
+            'stress_material': sigma_material / 1e6,  # Convert to MPa
+            'stress_global': sigma_global / 1e6
+        }
+    
+    def get_ply_stresses(self, loads) -> List[Dict[str, np.ndarray]]:
+        """
+        Calculate stresses in each ply for given loads
+        
+        Args:
+            loads: Dictionary of loads (Nx, Ny, Nxy, Mx, My, Mxy), or an array of
+                shape (6, k) holding k load cases in that order
+        
+        Returns:
+            List of dictionaries containing stresses for each ply; for k load
+            cases each strain and stress entry has shape (3, k)
+        """
+        load_vector = _load_vector(loads)
+        batch = self.get_ply_stresses_batch(load_vector.reshape(6, -1).T)
+        
+        # Per-ply arrays of shape (n, 3) for a single load case, else (n, 3, k)
+        keys = ('strain_material', 'strain_global', 'stress_material', 'stress_global')
+        if load_vector.ndim == 1:
+            per_ply = [batch[key][0] for key in keys]
+        else:
+            per_ply = [batch[key].transpose(1, 2, 0) for key in keys]
+        
+        ply_stresses = [
+            {
+                'ply_name': name or f"Ply {i + 1}",
+                'z_location': z_m,
+                'strain_material': eps_m,
+                'strain_global': eps_g,
+                'stress_material': sig_m,
+                'stress_global': sig_g
+            }
+            for i, (name, z_m, eps_m, eps_g, sig_m, sig_g) in enumerate(zip(
+                self._names, batch['z_location'], *per_ply))
+        ]
         
         return ply_stresses
 
+def create_layup_from_arrays(E11, E22, nu12, G12, thickness, orientation, density,
+                             names: Optional[List[str]] = None) -> CustomLayup:
+    """
+    Create a layup directly from per-ply property arrays, bottom ply first
+    
+    Args:
+        E11, E22, G12: Ply moduli (GPa)
+        nu12: Major Poisson's ratios
+        thickness: Ply thicknesses (mm)
+        orientation: Fiber orientation angles (degrees)
+        density: Ply densities (kg/m³)
+        names: Optional ply names
+    
+    Returns:
+        CustomLayup object
+    """
+    n = len(thickness)
+    # The compiled cores run without bounds checks, so a short array must not get through
+    arrays = {'E11': E11, 'E22': E22, 'nu12': nu12, 'G12': G12,
+              'orientation': orientation, 'density': density}
+    if names is not None:
+        arrays['names'] = names
+    for name, values in arrays.items():
+        if np.shape(values) != (n,):
+            raise ValueError(f"{name} must have one value per ply ({n}), got shape {np.shape(values)}")
+    
+    # Convert to SI units in one pass per quantity
+    moduli = np.empty((3, n))
+    np.multiply((E11, E22, G12), 1e9, out=moduli)
+    t = np.empty(n)
+    np.multiply(thickness, 1e-3, out=t)
+    
+    layup = CustomLayup.__new__(CustomLayup)
+    layup._set_ply_arrays(
+        E11=moduli[0],
+        E22=moduli[1],
+        nu12=np.array(nu12, dtype=np.float64),
+        G12=moduli[2],
+        thickness=t,
+        orientation=np.array(orientation, dtype=np.float64),
+        density=np.array(density, dtype=np.float64),
+        names=list(names) if names is not None else [''] * n
+    )
+    return layup
+
 def create_layup_from_sequence(sequence: List[Dict]) -> CustomLayup:
     """
     Create a layup from a sequence of ply definitions
@@ -284,31 +746,88 @@ def create_layup_from_sequence(sequence: List[Dict]) -> CustomLayup:
     Returns:
         CustomLayup object
     """
-    plies = []
-    
-    for ply_def in sequence:
-        if isinstance(ply_def['material_type'], MaterialType):
-            ply = PlyProperties.from_material_type(
-                material_type=ply_def['material_type'],
-                thickness=ply_def['thickness'],
-                orientation=ply_def['orientation'],
-                name=ply_def.get('name', '')
-            )
-        else:
-            # Custom material properties
-            ply = PlyProperties(
-                E11=ply_def['material_type']['E11'],
-                E22=ply_def['material_type']['E22'],
-                nu12=ply_def['material_type']['nu12'],
-                G12=ply_def['material_type']['G12'],
-                thickness=ply_def['thickness'],
-                orientation=ply_def['orientation'],
-                density=ply_def['material_type'].get('density', 1600),
-                name=ply_def.get('name', '')
-            )
-        plies.append(ply)
+    n = len(sequence)
+    materials = [
+        ply_def['material_type'].value if isinstance(ply_def['material_type'], MaterialType)
+        else ply_def['material_type']  # Custom material properties
+        for ply_def in sequence
+    ]
+    
+    return create_layup_from_arrays(
+        E11=np.fromiter((m['E11'] for m in materials), dtype=np.float64, count=n),
+        E22=np.fromiter((m['E22'] for m in materials), dtype=np.float64, count=n),
+        nu12=np.fromiter((m['nu12'] for m in materials), dtype=np.float64, count=n),
+        G12=np.fromiter((m['G12'] for m in materials), dtype=np.float64, count=n),
+        thickness=np.fromiter((ply_def['thickness'] for ply_def in sequence), dtype=np.float64, count=n),
+        orientation=np.fromiter((ply_def['orientation'] for ply_def in sequence), dtype=np.float64, count=n),
+        density=np.fromiter((m.get('density', 1600) for m in materials), dtype=np.float64, count=n),
+        names=[ply_def.get('name', '') for ply_def in sequence]
+    )
+
+def evaluate_layups_batch(layup_defs: List, loads) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+    """
+    Evaluate many layups under the same loads, in parallel when Numba is available
+    
+    Args:
+        layup_defs: CustomLayup objects, or ply sequences as accepted by create_layup_from_sequence
+        loads: Dictionary of loads (Nx, Ny, Nxy, Mx, My, Mxy), or an array of shape (6, k)
     
-    return CustomLayup(plies)
+    Returns:
+        Tuple of (effective properties, ply stresses). The properties are the keys
+        of calculate_effective_properties, each an array over layups. The stresses
+        hold 'stress_material' and 'stress_global' (MPa) of shape (L, max_plies, 3, k),
+        NaN past the end of shorter layups, and 'mask' (L, max_plies) marking real plies.
+    """
+    layups = [d if isinstance(d, CustomLayup) else create_layup_from_sequence(d) for d in layup_defs]
+    load_matrix = _load_vector(loads).reshape(6, -1)
+    n_layup = len(layups)
+    n_ply = np.array([len(layup._t) for layup in layups])
+    mask = np.arange(n_ply.max()) < n_ply[:, None]
+    
+    if _HAS_NUMBA:
+        # Pad to a rectangular (L, max_plies) layout; padded plies have zero
+        # thickness and weight, so they do not contribute
+        def padded(name, fill):
+            out = np.full(mask.shape, fill, dtype=np.float64)
+            out[mask] = np.concatenate([getattr(layup, name) for layup in layups])
+            return out
+        
+        props, sig_m, sig_g = _batch_layup_kernel(
+            padded('_E11', 1.0), padded('_E22', 1.0), padded('_nu12', 0.0), padded('_G12', 1.0),
+            padded('_theta', 0.0), padded('_dz', 0.0), padded('_dz2', 0.0), padded('_dz3', 0.0),
+            padded('_z_mid', 0.0), load_matrix
+        )
+        sig_m[~mask] = np.nan
+        sig_g[~mask] = np.nan
+        E_x, E_y, nu_xy, G_xy = props.T / np.array([[1e9], [1e9], [1], [1e9]])
+        stresses = {'stress_material': sig_m / 1e6, 'stress_global': sig_g / 1e6, 'mask': mask}
+    else:
+        E_x, E_y, nu_xy, G_xy = np.empty((4, n_layup))
+        stresses = {
+            'stress_material': np.full(mask.shape + (3, load_matrix.shape[1]), np.nan),
+            'stress_global': np.full(mask.shape + (3, load_matrix.shape[1]), np.nan),
+            'mask': mask
+        }
+        for l, layup in enumerate(layups):
+            p = layup.calculate_effective_properties()
+            E_x[l], E_y[l], nu_xy[l], G_xy[l] = p['E_x'], p['E_y'], p['nu_xy'], p['G_xy']
+            batch = layup.get_ply_stresses_batch(load_matrix.T)
+            n = len(layup._t)
+            stresses['stress_material'][l, :n] = batch['stress_material'].transpose(1, 2, 0)
+            stresses['stress_global'][l, :n] = batch['stress_global'].transpose(1, 2, 0)
+    
+    thickness = np.array([layup.total_thickness for layup in layups])
+    density = np.array([layup._density @ layup._t for layup in layups]) / thickness
+    properties = {
+        'E_x': E_x,
+        'E_y': E_y,
+        'nu_xy': nu_xy,
+        'G_xy': G_xy,
+        'thickness': thickness * 1000,
+        'density': density,
+        'mass_per_area': density * thickness
+    }
+    return properties, stresses
 
 if __name__ == "__main__":
     # Example 1: Using predefined materials
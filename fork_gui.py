@@ -1,12 +1,28 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from composite_analysis import PlyProperties, CompositeAnalysis, create_symmetric_layup
 from fork_simulation import MaterialProperties, ForkGeometry, ForkSimulation
 import json
 import os
+from typing import Tuple
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Optional faster JSON backend for the material database
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+MATERIALS_FILE = 'material_properties.json'
+
+def _read_vars(widget, variables) -> tuple:
+    """Values of several Tk variables as strings, fetched in a single Tcl call"""
+    script = "list " + " ".join(f"${{{var}}}" for var in variables)
+    return widget.tk.splitlist(widget.tk.eval(script))
 
 class PlyPropertiesFrame(ttk.LabelFrame):
     def __init__(self, parent, ply_number, *args, **kwargs):
@@ -23,22 +39,31 @@ class PlyPropertiesFrame(ttk.LabelFrame):
             ("Orientation (deg):", "orientation", 0)
         ]
         
+        # Parsed values, kept up to date as the entries are edited (NaN while invalid)
+        self._values = np.array([default for _, _, default in properties], dtype=float)
+        
         self.vars = {}
         for i, (label, name, default) in enumerate(properties):
             ttk.Label(self, text=label).grid(row=i, column=0, padx=5, pady=2, sticky='e')
             var = tk.DoubleVar(value=default)
             self.vars[name] = var
             ttk.Entry(self, textvariable=var, width=10).grid(row=i, column=1, padx=5, pady=2)
+            var.trace_add("write", lambda *args, i=i, var=var: self._parse_value(i, var))
+    
+    def _parse_value(self, i: int, var: tk.DoubleVar):
+        try:
+            self._values[i] = var.get()
+        except (tk.TclError, ValueError):
+            self._values[i] = np.nan
+    
+    def get_values(self) -> np.ndarray:
+        """E11, E22, nu12, G12, thickness and orientation, in PlyProperties field order"""
+        if np.isnan(self._values).any():
+            raise ValueError(f"Ply {self.ply_number} has a property that is not a number")
+        return self._values.copy()
     
     def get_properties(self) -> PlyProperties:
-        return PlyProperties(
-            E11=self.vars['e11'].get(),
-            E22=self.vars['e22'].get(),
-            nu12=self.vars['nu12'].get(),
-            G12=self.vars['g12'].get(),
-            thickness=self.vars['thickness'].get(),
-            orientation=self.vars['orientation'].get()
-        )
+        return PlyProperties(*self.get_values().tolist())
 
 class MaterialPropertiesFrame(ttk.LabelFrame):
     def __init__(self, parent, *args, **kwargs):
@@ -71,21 +96,76 @@ class MaterialPropertiesFrame(ttk.LabelFrame):
         self.description_var = tk.StringVar()
         ttk.Entry(self, textvariable=self.description_var, width=30).grid(
             row=len(properties), column=1, padx=5, pady=2)
+        self._names = tuple(self.vars)
+        self._var_list = tuple(self.vars.values())
+        self._defaults = {name: default for _, name, default in properties}
     
     def get_properties(self) -> dict:
-        return {name: var.get() for name, var in self.vars.items()}
+        name, *values = _read_vars(self, self._var_list)
+        values = np.array(values, dtype=float).tolist()
+        return {'name': name, **dict(zip(self._names[1:], values))}
     
     def set_properties(self, properties: dict):
         for name, value in properties.items():
             if name in self.vars:
                 self.vars[name].set(value)
+    
+    def set_properties_bulk(self, properties: dict):
+        """
+        Set every field and the description in one Tcl call
+        
+        Fields missing from properties (all of them for an empty dict) are reset
+        to their defaults rather than left showing the previous material.
+        """
+        values = [properties.get(name, self._defaults[name]) for name in self._names]
+        values.append(properties.get('description', ''))
+        variables = [str(var) for var in self._var_list + (self.description_var,)]
+        self.tk.call('lassign', tuple(values), *variables)
 
 class ForkSimulationGUI:
+    # Templates for the results panel, each written with a single insert
+    _RESULTS_TMPL = (
+        "Effective Laminate Properties:\n"
+        "E_x: {E_x:.2f} GPa\n"
+        "E_y: {E_y:.2f} GPa\n"
+        "nu_xy: {nu_xy:.3f}\n"
+        "G_xy: {G_xy:.2f} GPa\n"
+        "Total thickness: {thickness:.2f} mm\n"
+        "Density: {density:.1f} kg/m³\n"
+        "{extra}"
+        "\nLayup Sequence:\n"
+        "{plies}\n"
+    )
+    _THERMAL_TMPL = (
+        "\nThermal Properties:\n"
+        "αx: {thermal_expansion_x:.2e} /°C\n"
+        "αy: {thermal_expansion_y:.2e} /°C\n"
+    )
+    _MOISTURE_TMPL = (
+        "\nMoisture Properties:\n"
+        "βx: {moisture_expansion_x:.2e} /%\n"
+        "βy: {moisture_expansion_y:.2e} /%\n"
+    )
+    _FAILURE_TMPL = (
+        "\nFailure Analysis:\n"
+        "Maximum Failure Index: {max_failure_index:.3f}\n"
+        "{plies}\n"
+    )
+    
+    # Interval (ms) at which the Tk thread checks for finished background work
+    _POLL_MS = 20
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Composite Fork Simulator")
         self.root.geometry("1200x800")
         
+        # Background threads must not call Tk (not even root.after: that raises
+        # if the main loop is not running yet), so they hand (callback, args)
+        # to the Tk thread through this queue
+        self._results = queue.Queue()
+        self._pending = 0  # Background jobs whose callback has not run yet
+        
         # Create main notebook for tabs
         self.notebook = ttk.Notebook(root)
         self.notebook.pack(fill='both', expand=True, padx=5, pady=5)
@@ -104,9 +184,8 @@ class ForkSimulationGUI:
         
         # Store current layup and simulation
         self.current_layup = None
+        self._effective_props = None  # Effective properties of current_layup
         self.current_simulation = None
-        self.ply_frames = []
-        self.material_properties = {}
         self.load_material_properties()
         
         # Add thermal and moisture analysis options
@@ -130,9 +209,12 @@ class ForkSimulationGUI:
         ttk.Label(top_frame, text="Layup Type:").pack(side='left', padx=5)
         self.layup_type_var = tk.StringVar(value="symmetric")
         ttk.Radiobutton(top_frame, text="Symmetric", variable=self.layup_type_var, 
-                       value="symmetric", command=self.update_ply_frames).pack(side='left', padx=5)
+                       value="symmetric").pack(side='left', padx=5)
         ttk.Radiobutton(top_frame, text="Asymmetric", variable=self.layup_type_var,
-                       value="asymmetric", command=self.update_ply_frames).pack(side='left', padx=5)
+                       value="asymmetric").pack(side='left', padx=5)
+        # Rapid toggling is coalesced into one update
+        self._ply_update_job = None
+        self.layup_type_var.trace_add("write", self._schedule_ply_update)
         
         # Update button
         ttk.Button(top_frame, text="Update Ply Configuration", 
@@ -155,17 +237,23 @@ class ForkSimulationGUI:
         right_frame.pack(side='right', fill='both', expand=True, padx=5, pady=5)
         
         # Results display
-        self.results_text = tk.Text(right_frame, height=10, width=40)
+        # Read-only except while _write_results updates it
+        self.results_text = tk.Text(right_frame, height=10, width=40, state='disabled')
         self.results_text.pack(padx=5, pady=5, fill='both', expand=True)
         
         # Initialize ply frames
+        self.ply_frames = []
+        self._middle_ply_note = ttk.Label(self.left_frame, text="(Middle ply - will be duplicated)")
         self.update_ply_frames()
+    
+    def _schedule_ply_update(self, *args):
+        """Update the ply frames 100 ms after the last layup type change"""
+        if self._ply_update_job is not None:
+            self.root.after_cancel(self._ply_update_job)
+        self._ply_update_job = self.root.after(100, self.update_ply_frames)
         
     def update_ply_frames(self):
-        # Clear existing ply frames
-        for frame in self.ply_frames:
-            frame.destroy()
-        self.ply_frames.clear()
+        self._ply_update_job = None
         
         # Get number of plies
         num_plies = self.num_plies_var.get()
@@ -177,66 +265,81 @@ class ForkSimulationGUI:
         else:
             num_frames = num_plies
         
-        # Create new ply frames
-        for i in range(num_frames):
+        # Only create or destroy the difference, so existing frames keep their values
+        for i in range(len(self.ply_frames), num_frames):
             frame = PlyPropertiesFrame(self.left_frame, i + 1)
             frame.grid(row=i, column=0, padx=5, pady=5, sticky='nsew')
             self.ply_frames.append(frame)
-            
-            if is_symmetric and i == num_frames - 1 and num_plies % 2 == 0:
-                # Add a note for middle ply in symmetric layup
-                ttk.Label(self.left_frame, 
-                         text="(Middle ply - will be duplicated)").grid(
-                             row=i, column=1, padx=5, pady=5, sticky='w')
+        while len(self.ply_frames) > num_frames:
+            self.ply_frames.pop().destroy()
+        
+        if is_symmetric and num_frames and num_plies % 2 == 0:
+            # Add a note for middle ply in symmetric layup
+            self._middle_ply_note.grid(row=num_frames - 1, column=1, padx=5, pady=5, sticky='w')
+        else:
+            self._middle_ply_note.grid_remove()
+    
+    def _write_results(self, text: str, replace: bool = False):
+        """Append text to the results panel (or replace its contents) in one insert"""
+        self.results_text.configure(state='normal')
+        if replace:
+            self.results_text.delete(1.0, tk.END)
+        self.results_text.insert(tk.END, text)
+        self.results_text.configure(state='disabled')
+    
+    def _plies_to_soa(self) -> dict:
+        """Properties of every ply in the stacking sequence, one array per field"""
+        # One row per ply frame
+        values = np.array([frame.get_values() for frame in self.ply_frames]).reshape(-1, 6)
+        
+        # Create layup based on type
+        if self.layup_type_var.get() == "symmetric":
+            # For symmetric layup, mirror the plies
+            num_plies = self.num_plies_var.get()
+            n = len(values)
+            if num_plies % 2 == 0:
+                # Even number of plies
+                idx = np.concatenate([np.arange(n), np.arange(n)[::-1]])
+            else:
+                # Odd number of plies
+                idx = np.concatenate([np.arange(n - 1), np.arange(n)[::-1]])
+            values = values[idx]
+        
+        return dict(zip(('E11', 'E22', 'nu12', 'G12', 'thickness', 'orientation'), values.T))
+    
+    @staticmethod
+    def _format_ply_sequence(soa: dict) -> str:
+        """One line per ply of the stacking sequence, formatted with vectorized numpy.char calls"""
+        lines = np.char.mod('Ply %d: ', np.arange(1, len(soa['orientation']) + 1))
+        lines = np.char.add(lines, np.char.mod('%s° ', soa['orientation']))
+        lines = np.char.add(lines, np.char.mod('(E11=%.1f GPa, ', soa['E11']))
+        lines = np.char.add(lines, np.char.mod('t=%.2f mm)', soa['thickness']))
+        return "\n".join(lines.tolist())
     
     def create_layup(self):
         try:
-            # Get ply properties
-            plies = []
-            for frame in self.ply_frames:
-                plies.append(frame.get_properties())
+            # Create layup using new analysis code, straight from the ply arrays
+            soa = self._plies_to_soa()
+            self.current_layup = CompositeAnalysis.from_arrays(**soa)
             
-            # Create layup based on type
-            if self.layup_type_var.get() == "symmetric":
-                # For symmetric layup, mirror the plies
-                num_plies = self.num_plies_var.get()
-                if num_plies % 2 == 0:
-                    # Even number of plies
-                    plies = plies + plies[::-1]
-                else:
-                    # Odd number of plies
-                    plies = plies[:-1] + plies[::-1]
-            
-            # Create layup using new analysis code
-            self.current_layup = CompositeAnalysis(plies)
+            # Effective properties from the compliance the layup has already computed
             effective_props = self.current_layup.calculate_effective_properties()
-            
-            # Display results
-            self.results_text.delete(1.0, tk.END)
-            self.results_text.insert(tk.END, f"Effective Laminate Properties:\n")
-            self.results_text.insert(tk.END, f"E_x: {effective_props['E_x']:.2f} GPa\n")
-            self.results_text.insert(tk.END, f"E_y: {effective_props['E_y']:.2f} GPa\n")
-            self.results_text.insert(tk.END, f"nu_xy: {effective_props['nu_xy']:.3f}\n")
-            self.results_text.insert(tk.END, f"G_xy: {effective_props['G_xy']:.2f} GPa\n")
-            self.results_text.insert(tk.END, f"Total thickness: {effective_props['thickness']:.2f} mm\n")
-            self.results_text.insert(tk.END, f"Density: {effective_props['density']:.1f} kg/m³\n")
+            self._effective_props = effective_props
+            self._sim_dirty = True
             
             # Add thermal and moisture properties if available
+            extra = ""
             if effective_props.get('thermal_expansion_x'):
-                self.results_text.insert(tk.END, f"\nThermal Properties:\n")
-                self.results_text.insert(tk.END, f"αx: {effective_props['thermal_expansion_x']:.2e} /°C\n")
-                self.results_text.insert(tk.END, f"αy: {effective_props['thermal_expansion_y']:.2e} /°C\n")
-            
+                extra += self._THERMAL_TMPL.format(**effective_props)
             if effective_props.get('moisture_expansion_x'):
-                self.results_text.insert(tk.END, f"\nMoisture Properties:\n")
-                self.results_text.insert(tk.END, f"βx: {effective_props['moisture_expansion_x']:.2e} /%\n")
-                self.results_text.insert(tk.END, f"βy: {effective_props['moisture_expansion_y']:.2e} /%\n")
+                extra += self._MOISTURE_TMPL.format(**effective_props)
             
-            # Add layup sequence
-            self.results_text.insert(tk.END, f"\nLayup Sequence:\n")
-            for i, ply in enumerate(plies):
-                self.results_text.insert(tk.END, 
-                    f"Ply {i+1}: {ply.orientation}° (E11={ply.E11:.1f} GPa, t={ply.thickness:.2f} mm)\n")
+            # Display results, including the layup sequence
+            sequence = self._format_ply_sequence(soa)
+            self._write_results(
+                self._RESULTS_TMPL.format(**effective_props, extra=extra, plies=sequence),
+                replace=True
+            )
             
             messagebox.showinfo("Success", "Layup created successfully!")
             
@@ -264,6 +367,12 @@ class ForkSimulationGUI:
             var = tk.DoubleVar(value=default)
             self.geometry_vars[name] = var
             ttk.Entry(geometry_frame, textvariable=var, width=10).grid(row=i, column=1, padx=5, pady=2)
+            var.trace_add("write", self._mark_simulation_dirty)
+        
+        # The simulation only depends on the layup, geometry and density; loads are
+        # arguments to its methods, so changing them does not need a new one
+        self._sim_dirty = True
+        self._sim_rho = None
         
         # Load inputs
         load_frame = ttk.LabelFrame(left_frame, text="Loads")
@@ -287,21 +396,161 @@ class ForkSimulationGUI:
         button_frame = ttk.Frame(left_frame)
         button_frame.pack(fill='x', padx=5, pady=5)
         
-        ttk.Button(button_frame, text="Stress Analysis", command=self.run_stress_analysis).pack(side='left', padx=5)
-        ttk.Button(button_frame, text="Vibration Analysis", command=self.run_vibration_analysis).pack(side='left', padx=5)
+        self._analysis_buttons = [
+            ttk.Button(button_frame, text="Stress Analysis", command=self.run_stress_analysis),
+            ttk.Button(button_frame, text="Vibration Analysis", command=self.run_vibration_analysis)
+        ]
+        for button in self._analysis_buttons:
+            button.pack(side='left', padx=5)
+        
+        # Analyses run on a single worker thread; results are drawn back on the Tk thread
+        self._pool = ThreadPoolExecutor(max_workers=1)
         
         # Right frame for plots
         self.plot_frame = ttk.LabelFrame(self.simulation_tab, text="Results")
         self.plot_frame.pack(side='right', fill='both', expand=True, padx=5, pady=5)
         
-    def run_stress_analysis(self):
-        if not self.current_layup:
-            messagebox.showerror("Error", "Please create a layup first!")
+        # The figure is created by _ensure_mpl on the first analysis
+        self.fig = None
+        self.canvas = None
+        self._plot_mode = None  # Which analysis the axes currently show
+        self._plot_artists = []
+        self._plot_background = None
+    
+    def _mark_simulation_dirty(self, *args):
+        self._sim_dirty = True
+    
+    def _ensure_mpl(self):
+        """
+        Import matplotlib and create the plot canvas, the first time a plot is shown
+        
+        Keeping matplotlib off the startup path lets the window appear sooner.
+        There is one figure and canvas for the lifetime of the tab; analyses update
+        the artists on it and blit them over a cached background. The Figure is
+        built directly rather than through pyplot, so it is never registered with
+        pyplot's figure manager and is freed with the tab.
+        """
+        if self.canvas is not None:
             return
-            
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        
+        self.fig = Figure(figsize=(12, 8))
+        self.ax_top = self.fig.add_subplot(2, 1, 1)
+        self.ax_bottom = self.fig.add_subplot(2, 1, 2)
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self.plot_frame)
+        self.canvas.get_tk_widget().pack(fill='both', expand=True)
+        self.canvas.mpl_connect('draw_event', self._on_canvas_draw)
+    
+    def _on_canvas_draw(self, event):
+        """Cache the static background after every full redraw (including resizes)"""
+        self._plot_background = self.canvas.copy_from_bbox(self.fig.bbox)
+        for artist in self._plot_artists:
+            self.fig.draw_artist(artist)
+    
+    def _expect_result(self):
+        """Count one more background job and poll for its result from the Tk thread"""
+        self._pending += 1
+        if self._pending == 1:
+            self.root.after(self._POLL_MS, self._poll_results)
+    
+    def _poll_results(self):
+        """Run the callbacks of finished background jobs; keep polling while any are outstanding"""
         try:
-            # Get effective properties
-            effective_props = self.current_layup.calculate_effective_properties()
+            while self._pending:
+                try:
+                    callback, args = self._results.get_nowait()
+                except queue.Empty:
+                    break
+                self._pending -= 1
+                callback(*args)
+        finally:
+            if self._pending:
+                self.root.after(self._POLL_MS, self._poll_results)
+    
+    def _submit_analysis(self, compute, render, *args):
+        """
+        Run compute(*args) on the worker thread, then render(future) on the Tk thread
+        
+        The analysis buttons are disabled while it runs, so only one analysis is
+        in flight at a time.
+        """
+        for button in self._analysis_buttons:
+            button.state(['disabled'])
+        self._expect_result()
+        future = self._pool.submit(compute, *args)
+        future.add_done_callback(lambda f: self._results.put((self._finish_analysis, (render, f))))
+    
+    def _finish_analysis(self, render, future):
+        for button in self._analysis_buttons:
+            button.state(['!disabled'])
+        render(future)
+    
+    def _request_full_draw(self):
+        """Schedule a full redraw for when Tk is idle; the background is recaptured then"""
+        # Until that draw happens the cached background is stale, so don't blit over it
+        self._plot_background = None
+        self.canvas.draw_idle()
+    
+    def _show_plot(self, mode, build, data):
+        """
+        Show an analysis on the persistent figure
+        
+        Args:
+            mode: Name of the analysis; the axes are rebuilt only when it changes
+            build: Callable drawing the axes from scratch and returning the data artists
+            data: (x, y) pairs, one per artist, used to update them in place
+        """
+        self._ensure_mpl()
+        if mode != self._plot_mode:
+            self.ax_top.clear()
+            self.ax_bottom.clear()
+            self._plot_artists = build()
+            for artist in self._plot_artists:
+                artist.set_animated(True)
+            self.fig.tight_layout()
+            self._plot_mode = mode
+            self._request_full_draw()
+            return
+        
+        for artist, (x, y) in zip(self._plot_artists, data):
+            artist.set_data(x, y)
+        
+        # Axis limits and tick labels live in the background, so only blit
+        # when the new data fits the current view
+        axes = (self.ax_top, self.ax_bottom)
+        old_limits = [ax.get_xlim() + ax.get_ylim() for ax in axes]
+        for ax in axes:
+            ax.relim()
+            ax.autoscale_view()
+        if self._plot_background is None or old_limits != [ax.get_xlim() + ax.get_ylim() for ax in axes]:
+            self._request_full_draw()
+            return
+        
+        self.canvas.restore_region(self._plot_background)
+        for artist in self._plot_artists:
+            self.fig.draw_artist(artist)
+        self.canvas.blit(self.fig.bbox)
+    
+    def _read_floats(self, variables: dict) -> dict:
+        """Values of a name -> variable mapping as floats, fetched in a single Tcl call"""
+        return dict(zip(variables, map(float, _read_vars(self.root, variables.values()))))
+    
+    def _build_simulation(self, rho: float) -> Tuple[MaterialProperties, ForkGeometry, ForkSimulation]:
+        """
+        Material, geometry and simulation for the current layup and geometry inputs
+        
+        The objects are reused until the layup, a geometry input or rho changes.
+        
+        Args:
+            rho: Density (kg/m³) to give the fork material
+        
+        Returns:
+            Tuple of (material, geometry, simulation), also kept as current_simulation
+        """
+        if self._sim_dirty or self._sim_rho != rho:
+            # Effective properties, computed once when the layup was created
+            effective_props = self._effective_props
             
             # Create material properties from layup
             material = MaterialProperties(
@@ -309,89 +558,122 @@ class ForkSimulationGUI:
                 E_transverse=effective_props['E_y'],
                 G=effective_props['G_xy'],
                 nu=effective_props['nu_xy'],
-                rho=effective_props['density'],
+                rho=rho,
                 cost_per_kg=50,  # Assuming cost
                 damping_ratio=0.01
             )
             
             # Create geometry
-            geometry = ForkGeometry(
-                length=self.geometry_vars['length'].get(),
-                outer_diameter=self.geometry_vars['outer_diameter'].get(),
-                wall_thickness=self.geometry_vars['wall_thickness'].get()
-            )
+            geometry = ForkGeometry(**self._read_floats(self.geometry_vars))
             
             # Create simulation
             self.current_simulation = ForkSimulation(material, geometry)
+            self._sim_dirty = False
+            self._sim_rho = rho
+        
+        simulation = self.current_simulation
+        return simulation.material, simulation.geometry, simulation
+    
+    def run_stress_analysis(self):
+        if not self.current_layup:
+            messagebox.showerror("Error", "Please create a layup first!")
+            return
             
-            # Run analysis
-            axial_force = self.load_vars['axial_force'].get()
-            transverse_force = self.load_vars['transverse_force'].get()
-            
-            # Calculate laminate stresses
-            loads = {
-                'Nx': axial_force / (2 * np.pi * geometry.outer_diameter),  # Convert to N/m
-                'Ny': 0,
-                'Nxy': 0,
-                'Mx': transverse_force * geometry.length / 4,  # Approximate moment
-                'My': 0,
-                'Mxy': 0
-            }
-            
-            stress_strain = self.current_layup.calculate_stress_strain(loads)
-            failure = self.current_layup.calculate_failure(loads)
-            
-            # Create figure with subplots
-            fig = plt.figure(figsize=(12, 8))
-            
-            # Plot stress distribution
-            plt.subplot(2, 1, 1)
-            x = np.linspace(0, geometry.length, 100)
-            axial_stress = np.full_like(x, self.current_simulation.axial_stress(axial_force))
-            bending_stress = self.current_simulation.bending_stress(transverse_force, x)
-            total_stress = axial_stress + bending_stress
-            
-            plt.plot(x, axial_stress/1e6, label='Axial Stress')
-            plt.plot(x, bending_stress/1e6, label='Bending Stress')
-            plt.plot(x, total_stress/1e6, label='Total Stress')
-            plt.xlabel('Distance from base (m)')
-            plt.ylabel('Stress (MPa)')
-            plt.title('Stress Distribution Along Fork')
-            plt.legend()
-            plt.grid(True)
-            
-            # Plot through-thickness stress distribution
-            plt.subplot(2, 1, 2)
-            z = np.linspace(-self.current_layup.total_thickness/2, 
-                           self.current_layup.total_thickness/2, 
-                           len(stress_strain['stresses']))
-            plt.plot(stress_strain['stresses'][:,0]/1e6, z, label='σx')
-            plt.plot(stress_strain['stresses'][:,1]/1e6, z, label='σy')
-            plt.plot(stress_strain['stresses'][:,2]/1e6, z, label='τxy')
-            plt.xlabel('Stress (MPa)')
-            plt.ylabel('Through-thickness position (mm)')
-            plt.title('Through-thickness Stress Distribution')
-            plt.legend()
-            plt.grid(True)
+        try:
+            _, _, simulation = self._build_simulation(rho=self._effective_props['density'])
             
-            plt.tight_layout()
+            # Run analysis
+            loads = self._read_floats(self.load_vars)
             
-            # Clear previous plot
-            for widget in self.plot_frame.winfo_children():
-                widget.destroy()
+            self._submit_analysis(self._compute_stress, self._render_stress, simulation,
+                                  self.current_layup, loads['axial_force'], loads['transverse_force'])
             
-            # Add new plot
-            canvas = FigureCanvasTkAgg(fig, master=self.plot_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill='both', expand=True)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to run stress analysis: {str(e)}")
+    
+    @staticmethod
+    def _compute_stress(simulation, layup, axial_force, transverse_force) -> dict:
+        """Stress analysis results as plain arrays; runs on the worker thread"""
+        geometry = simulation.geometry
+        
+        # Calculate laminate stresses
+        loads = {
+            'Nx': axial_force / (2 * np.pi * geometry.outer_diameter),  # Convert to N/m
+            'Ny': 0,
+            'Nxy': 0,
+            'Mx': transverse_force * geometry.length / 4,  # Approximate moment
+            'My': 0,
+            'Mxy': 0
+        }
+        
+        stress_strain = layup.calculate_stress_strain(loads)
+        failure = layup.calculate_failure(loads)
+        
+        # Stress distribution along the fork and through the thickness
+        x, axial_stress, bending_stress, total_stress = \
+            simulation.stress_distribution(axial_force, transverse_force)
+        stresses = stress_strain['stresses'] / 1e6
+        z = np.linspace(-layup.total_thickness/2, 
+                       layup.total_thickness/2, 
+                       len(stresses))
+        
+        return {
+            'x': x,
+            'axial_stress': axial_stress,
+            'bending_stress': bending_stress,
+            'total_stress': total_stress,
+            'stresses': stresses,
+            'z': z,
+            'failure': failure
+        }
+    
+    def _render_stress(self, future):
+        """Plot a finished stress analysis and add its failure summary"""
+        try:
+            result = future.result()
+            x, z, stresses = result['x'], result['z'], result['stresses']
+            along = [
+                (x, result['axial_stress']/1e6), (x, result['bending_stress']/1e6),
+                (x, result['total_stress']/1e6)
+            ]
+            
+            def build():
+                # Plot the arrays computed on the worker thread, so a mode switch
+                # does not redo the analysis here
+                ax = self.ax_top
+                lines = []
+                for (x_data, y_data), label in zip(along, ('Axial Stress', 'Bending Stress', 'Total Stress')):
+                    lines += ax.plot(x_data, y_data, label=label)
+                ax.set_xlabel('Distance from base (m)')
+                ax.set_ylabel('Stress (MPa)')
+                ax.set_title('Stress Distribution Along Fork')
+                ax.legend()
+                ax.grid(True)
+                
+                ax = self.ax_bottom
+                lines += ax.plot(stresses[:,0], z, label='σx')
+                lines += ax.plot(stresses[:,1], z, label='σy')
+                lines += ax.plot(stresses[:,2], z, label='τxy')
+                ax.set_xlabel('Stress (MPa)')
+                ax.set_ylabel('Through-thickness position (mm)')
+                ax.set_title('Through-thickness Stress Distribution')
+                ax.legend()
+                ax.grid(True)
+                return lines
+            
+            self._show_plot('stress', build, along + [
+                (stresses[:,0], z), (stresses[:,1], z), (stresses[:,2], z)
+            ])
             
             # Add failure analysis results
-            self.results_text.insert(tk.END, f"\nFailure Analysis:\n")
-            self.results_text.insert(tk.END, f"Maximum Failure Index: {failure['max_failure_index']:.3f}\n")
+            failure = result['failure']
             if failure['failed_plies']:
-                self.results_text.insert(tk.END, f"Failed Plies: {failure['failed_plies']}\n")
+                failed = f"Failed Plies: {failure['failed_plies']}"
             else:
-                self.results_text.insert(tk.END, "No ply failures predicted\n")
+                failed = "No ply failures predicted"
+            self._write_results(self._FAILURE_TMPL.format(
+                max_failure_index=failure['max_failure_index'], plies=failed
+            ))
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to run stress analysis: {str(e)}")
@@ -402,62 +684,67 @@ class ForkSimulationGUI:
             return
             
         try:
-            # Get effective properties
-            effective_props = self.current_layup.calculate_effective_properties()
+            _, _, simulation = self._build_simulation(rho=1600)  # Assuming density
             
-            # Create material properties from layup
-            material = MaterialProperties(
-                E_axial=effective_props['E_x'],
-                E_transverse=effective_props['E_y'],
-                G=effective_props['G_xy'],
-                nu=effective_props['nu_xy'],
-                rho=1600,  # Assuming density
-                cost_per_kg=50,  # Assuming cost
-                damping_ratio=0.01
-            )
-            
-            # Create geometry
-            geometry = ForkGeometry(
-                length=self.geometry_vars['length'].get(),
-                outer_diameter=self.geometry_vars['outer_diameter'].get(),
-                wall_thickness=self.geometry_vars['wall_thickness'].get()
-            )
-            
-            # Create simulation
-            self.current_simulation = ForkSimulation(material, geometry)
-            
-            # Create figure with subplots
-            fig = plt.figure(figsize=(12, 8))
-            
-            # Plot frequency response
-            plt.subplot(2, 1, 1)
-            self.current_simulation.plot_frequency_response(
-                self.load_vars['vibration_force'].get(),
-                (0, 100)
-            )
-            
-            # Plot steady state vibration
-            plt.subplot(2, 1, 2)
-            self.current_simulation.plot_steady_state_vibration(
-                self.load_vars['vibration_force'].get(),
-                self.load_vars['vibration_freq'].get()
-            )
+            loads = self._read_floats(self.load_vars)
             
-            plt.tight_layout()
+            self._submit_analysis(self._compute_vibration, self._render_vibration,
+                                  simulation, loads['vibration_force'], loads['vibration_freq'])
             
-            # Clear previous plot
-            for widget in self.plot_frame.winfo_children():
-                widget.destroy()
-            
-            # Add new plot
-            canvas = FigureCanvasTkAgg(fig, master=self.plot_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill='both', expand=True)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to run vibration analysis: {str(e)}")
+    
+    @staticmethod
+    def _compute_vibration(simulation, force, frequency) -> dict:
+        """Vibration analysis results as plain arrays; runs on the worker thread"""
+        # Frequency response and steady state vibration
+        freq, amplitude = simulation.frequency_response(force, (0, 100))
+        t, _, response = simulation.steady_state_vibration(force, frequency)
+        return {
+            'freq': freq,
+            'amplitude': amplitude,
+            't': t,
+            'response': response
+        }
+    
+    def _render_vibration(self, future):
+        """Plot a finished vibration analysis"""
+        try:
+            result = future.result()
+            data = [
+                (result['freq'], result['amplitude'] * 1000),  # Convert to mm
+                (result['t'], result['response'] * 1000)
+            ]
+            
+            def build():
+                # Plot the arrays computed on the worker thread, so a mode switch
+                # does not redo the analysis here
+                ax = self.ax_top
+                lines = ax.plot(*data[0])
+                ax.set_xlabel('Frequency (Hz)')
+                ax.set_ylabel('Amplitude (mm)')
+                ax.set_title('Frequency Response')
+                ax.grid(True)
+                
+                ax = self.ax_bottom
+                lines += ax.plot(*data[1], label='Response')
+                ax.set_xlabel('Time (s)')
+                ax.set_ylabel('Displacement (mm)')
+                ax.set_title('Steady-State Response')
+                ax.grid(True)
+                ax.legend()
+                return lines
+            
+            self._show_plot('vibration', build, data)
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to run vibration analysis: {str(e)}")
 
     def setup_materials_tab(self):
+        # Saved materials, filled in once the background load finishes
+        self.material_properties = {}
+        self._materials_dirty = False
+        
         # Left frame for material input
         left_frame = ttk.Frame(self.materials_tab)
         left_frame.pack(side='left', fill='both', expand=True, padx=5, pady=5)
@@ -480,9 +767,12 @@ class ForkSimulationGUI:
         right_frame.pack(side='right', fill='both', expand=True, padx=5, pady=5)
         
         # Material list
-        self.material_listbox = tk.Listbox(right_frame, height=10)
-        self.material_listbox.pack(fill='both', expand=True, padx=5, pady=5)
-        self.material_listbox.bind('<<ListboxSelect>>', self.on_material_select)
+        # Items are keyed by material name, so the list can be updated incrementally
+        self.material_tree = ttk.Treeview(right_frame, columns=('name',), show='headings',
+                                          height=10, selectmode='browse')
+        self.material_tree.heading('name', text='Name')
+        self.material_tree.pack(fill='both', expand=True, padx=5, pady=5)
+        self.material_tree.bind('<<TreeviewSelect>>', self.on_material_select)
         
         # Description display
         self.description_text = tk.Text(right_frame, height=5, width=40)
@@ -504,6 +794,7 @@ class ForkSimulationGUI:
         
         # Save to dictionary
         self.material_properties[name] = properties
+        self._materials_dirty = True
         
         # Save to file
         self.save_material_properties()
@@ -513,55 +804,89 @@ class ForkSimulationGUI:
         messagebox.showinfo("Success", f"Material '{name}' saved successfully")
     
     def delete_material(self):
-        selection = self.material_listbox.curselection()
+        selection = self.material_tree.selection()
         if not selection:
             messagebox.showerror("Error", "Please select a material to delete")
             return
         
-        name = self.material_listbox.get(selection[0])
+        name = selection[0]
         if messagebox.askyesno("Confirm", f"Delete material '{name}'?"):
             del self.material_properties[name]
+            self._materials_dirty = True
             self.save_material_properties()
             self.update_material_list()
-            self.material_frame.set_properties({})
-            self.material_frame.description_var.set("")
+            self.material_frame.set_properties_bulk({})
     
     def on_material_select(self, event):
-        selection = self.material_listbox.curselection()
+        selection = self.material_tree.selection()
         if not selection:
             return
         
-        name = self.material_listbox.get(selection[0])
+        name = selection[0]
         properties = self.material_properties[name]
         
         # Update material frame
-        self.material_frame.set_properties(properties)
-        self.material_frame.description_var.set(properties.get('description', ''))
+        self.material_frame.set_properties_bulk(properties)
         
         # Update description text
         self.description_text.delete(1.0, tk.END)
         self.description_text.insert(tk.END, properties.get('description', ''))
     
     def update_material_list(self):
-        self.material_listbox.delete(0, tk.END)
-        for name in sorted(self.material_properties.keys()):
-            self.material_listbox.insert(tk.END, name)
+        # Only insert and delete the materials that changed
+        names = sorted(self.material_properties.keys())
+        current = set(self.material_tree.get_children())
+        removed = current.difference(names)
+        if removed:
+            self.material_tree.delete(*removed)
+        for i, name in enumerate(names):
+            if name not in current:
+                # Existing items are already sorted, so this keeps the list in order
+                self.material_tree.insert('', i, iid=name, values=(name,))
     
     def save_material_properties(self):
+        """Write the materials to disk if they changed since the last write"""
+        if not self._materials_dirty:
+            return
         try:
-            with open('material_properties.json', 'w') as f:
-                json.dump(self.material_properties, f, indent=4)
+            # Write to a temporary file and swap it in, so a failed write
+            # never leaves a truncated database behind
+            tmp_file = MATERIALS_FILE + '.tmp'
+            if _HAS_ORJSON:
+                with open(tmp_file, 'wb') as f:
+                    f.write(orjson.dumps(self.material_properties,
+                                         option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+            else:
+                with open(tmp_file, 'w') as f:
+                    json.dump(self.material_properties, f, indent=4)
+            os.replace(tmp_file, MATERIALS_FILE)
+            self._materials_dirty = False
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save material properties: {str(e)}")
     
     def load_material_properties(self):
+        """Read the saved materials on a background thread so startup is not blocked"""
+        self._expect_result()
+        threading.Thread(target=self._read_material_file, daemon=True).start()
+    
+    def _read_material_file(self):
+        materials, error = {}, None
         try:
-            if os.path.exists('material_properties.json'):
-                with open('material_properties.json', 'r') as f:
-                    self.material_properties = json.load(f)
+            if os.path.exists(MATERIALS_FILE):
+                with open(MATERIALS_FILE, 'rb') as f:
+                    data = f.read()
+                materials = orjson.loads(data) if _HAS_ORJSON else json.loads(data)
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to load material properties: {str(e)}")
-            self.material_properties = {}
+            error = e
+        self._results.put((self._apply_loaded_materials, (materials, error)))
+    
+    def _apply_loaded_materials(self, materials, error):
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to load material properties: {str(error)}")
+        # Materials saved while the file was loading take precedence
+        materials.update(self.material_properties)
+        self.material_properties = materials
+        self.update_material_list()
 
 if __name__ == "__main__":
     root = tk.Tk()
@@ -1,11 +1,33 @@
 import tkinter as tk
+from functools import lru_cache
 from tkinter import ttk, messagebox
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from composite_layup import PlyProperties, CompositeLayup, create_symmetric_layup
 from fork_simulation import MaterialProperties, ForkGeometry, ForkSimulation
 
+@lru_cache(maxsize=64)
+def _build_layup(E11: float, E22: float, nu12: float, G12: float, thickness: float,
+                 orientations: tuple) -> tuple:
+    """
+    Symmetric layup and its effective properties, cached on the inputs
+    
+    Returns:
+        Tuple of (layup, effective properties); both are shared between calls with
+        the same inputs and should not be modified
+    """
+    ply_props = PlyProperties(
+        E11=E11,
+        E22=E22,
+        nu12=nu12,
+        G12=G12,
+        thickness=thickness,
+        orientation=0  # Will be set in layup
+    )
+    layup = create_symmetric_layup(ply_props, list(orientations))
+    return layup, layup.calculate_effective_properties()
+
 class ForkSimulationGUI:
     def __init__(self, root):
         self.root = root
@@ -29,7 +51,9 @@ class ForkSimulationGUI:
         
         # Store current layup and simulation
         self.current_layup = None
+        self._effective_props = None  # Effective properties of current_layup
         self.current_simulation = None
+        self._simulation_key = None  # Geometry inputs current_simulation was built from
         
     def setup_layup_tab(self):
         # Left frame for ply properties
@@ -119,24 +143,28 @@ class ForkSimulationGUI:
         self.plot_frame = ttk.LabelFrame(self.simulation_tab, text="Results")
         self.plot_frame.pack(side='right', fill='both', expand=True, padx=5, pady=5)
         
+        # One figure and canvas, cleared and redrawn for each analysis
+        self.fig = Figure(figsize=(8, 6))
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self.plot_frame)
+        self.canvas.get_tk_widget().pack(fill='both', expand=True)
+        
     def create_layup(self):
         try:
-            # Get ply properties
-            ply_props = PlyProperties(
-                E11=self.ply_vars['e11'].get(),
-                E22=self.ply_vars['e22'].get(),
-                nu12=self.ply_vars['nu12'].get(),
-                G12=self.ply_vars['g12'].get(),
-                thickness=self.ply_vars['thickness'].get(),
-                orientation=0  # Will be set in layup
-            )
-            
             # Get orientations
-            orientations = [float(x.strip()) for x in self.orientations_var.get().split(',')]
+            orientations = tuple(float(x.strip()) for x in self.orientations_var.get().split(','))
             
-            # Create layup
-            self.current_layup = create_symmetric_layup(ply_props, orientations)
-            effective_props = self.current_layup.calculate_effective_properties()
+            # Create layup (reused if the inputs have not changed)
+            self.current_layup, effective_props = _build_layup(
+                self.ply_vars['e11'].get(),
+                self.ply_vars['e22'].get(),
+                self.ply_vars['nu12'].get(),
+                self.ply_vars['g12'].get(),
+                self.ply_vars['thickness'].get(),
+                orientations
+            )
+            if effective_props is not self._effective_props:
+                self._effective_props = effective_props
+                self.current_simulation = None  # Rebuilt for the new layup on the next analysis
             
             # Display results
             self.results_text.delete(1.0, tk.END)
@@ -152,14 +180,13 @@ class ForkSimulationGUI:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to create layup: {str(e)}")
     
-    def run_stress_analysis(self):
-        if not self.current_layup:
-            messagebox.showerror("Error", "Please create a layup first!")
-            return
-            
-        try:
-            # Get effective properties
-            effective_props = self.current_layup.calculate_effective_properties()
+    def _get_simulation(self) -> ForkSimulation:
+        """The simulation for the current layup and geometry, rebuilt only when they change"""
+        geom = {name: var.get() for name, var in self.geometry_vars.items()}
+        key = tuple(geom.values())
+        if self.current_simulation is None or key != self._simulation_key:
+            # Effective properties, computed once when the layup was created
+            effective_props = self._effective_props
             
             # Create material properties from layup
             material = MaterialProperties(
@@ -173,31 +200,31 @@ class ForkSimulationGUI:
             )
             
             # Create geometry
-            geometry = ForkGeometry(
-                length=self.geometry_vars['length'].get(),
-                outer_diameter=self.geometry_vars['outer_diameter'].get(),
-                wall_thickness=self.geometry_vars['wall_thickness'].get()
-            )
+            geometry = ForkGeometry(**geom)
             
             # Create simulation
             self.current_simulation = ForkSimulation(material, geometry)
+            self._simulation_key = key
+        return self.current_simulation
+    
+    def run_stress_analysis(self):
+        if not self.current_layup:
+            messagebox.showerror("Error", "Please create a layup first!")
+            return
             
-            # Run analysis
-            axial_force = self.load_vars['axial_force'].get()
-            transverse_force = self.load_vars['transverse_force'].get()
-            
-            # Create figure
-            fig = plt.figure(figsize=(8, 6))
-            self.current_simulation.plot_stress_distribution(axial_force, transverse_force)
+        try:
+            # Reuse the simulation (and its cached derived values) if nothing changed
+            self._get_simulation()
             
-            # Clear previous plot
-            for widget in self.plot_frame.winfo_children():
-                widget.destroy()
+            # Run analysis
+            loads = {name: var.get() for name, var in self.load_vars.items()}
             
-            # Add new plot
-            canvas = FigureCanvasTkAgg(fig, master=self.plot_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill='both', expand=True)
+            # Replace the previous plot
+            self.fig.clear()
+            self.current_simulation.plot_stress_distribution(
+                loads['axial_force'], loads['transverse_force'], ax=self.fig.add_subplot()
+            )
+            self.canvas.draw_idle()
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to run stress analysis: {str(e)}")
@@ -208,57 +235,30 @@ class ForkSimulationGUI:
             return
             
         try:
-            # Get effective properties
-            effective_props = self.current_layup.calculate_effective_properties()
+            # Reuse the simulation (and its cached derived values) if nothing changed
+            self._get_simulation()
+            loads = {name: var.get() for name, var in self.load_vars.items()}
             
-            # Create material properties from layup
-            material = MaterialProperties(
-                E_axial=effective_props['E_x'],
-                E_transverse=effective_props['E_y'],
-                G=effective_props['G_xy'],
-                nu=effective_props['nu_xy'],
-                rho=1600,  # Assuming density
-                cost_per_kg=50,  # Assuming cost
-                damping_ratio=0.01
-            )
-            
-            # Create geometry
-            geometry = ForkGeometry(
-                length=self.geometry_vars['length'].get(),
-                outer_diameter=self.geometry_vars['outer_diameter'].get(),
-                wall_thickness=self.geometry_vars['wall_thickness'].get()
-            )
-            
-            # Create simulation
-            self.current_simulation = ForkSimulation(material, geometry)
-            
-            # Create figure with subplots
-            fig = plt.figure(figsize=(12, 8))
+            # Replace the previous plot with two subplots
+            self.fig.clear()
+            ax_top, ax_bottom = self.fig.subplots(2, 1)
             
             # Plot frequency response
-            plt.subplot(2, 1, 1)
             self.current_simulation.plot_frequency_response(
-                self.load_vars['vibration_force'].get(),
-                (0, 100)
+                loads['vibration_force'],
+                (0, 100),
+                ax=ax_top
             )
             
             # Plot steady state vibration
-            plt.subplot(2, 1, 2)
             self.current_simulation.plot_steady_state_vibration(
-                self.load_vars['vibration_force'].get(),
-                self.load_vars['vibration_freq'].get()
+                loads['vibration_force'],
+                loads['vibration_freq'],
+                ax=ax_bottom
             )
             
-            plt.tight_layout()
-            
-            # Clear previous plot
-            for widget in self.plot_frame.winfo_children():
-                widget.destroy()
-            
-            # Add new plot
-            canvas = FigureCanvasTkAgg(fig, master=self.plot_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill='both', expand=True)
+            self.fig.tight_layout()
+            self.canvas.draw_idle()
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to run vibration analysis: {str(e)}")
@@ -1,9 +1,78 @@
+import math
 import numpy as np
-import matplotlib.pyplot as plt
-from dataclasses import dataclass
-from typing import Tuple, Optional
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import TYPE_CHECKING, Tuple, Optional
 
-@dataclass
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+
+# Optional fused evaluation of the time-domain response expressions
+try:
+    import numexpr as ne
+    _HAS_NUMEXPR = True
+except ImportError:
+    _HAS_NUMEXPR = False
+
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+# Sample grids only ever reach the screen, so they are held in single precision
+_PLOT_DTYPE = np.float32
+
+def _pyplot():
+    """Import pyplot on first use, so importing this module does not load matplotlib"""
+    import matplotlib.pyplot as plt
+    return plt
+
+def _step_underdamped(t, static, zeta, omega_n, omega_d, out):
+    """Underdamped step response written sample by sample into `out`"""
+    decay = zeta * omega_n
+    ratio = decay / omega_d
+    for i in range(t.shape[0]):
+        wt = omega_d * t[i]
+        out[i] = static * (1 - math.exp(-decay * t[i]) * (math.cos(wt) + ratio * math.sin(wt)))
+
+if _HAS_NUMBA:
+    # Compiled on first use, so importing this module does not pay the JIT cost;
+    # a few hundred samples are too few to be worth spreading across threads
+    _step_underdamped = njit(cache=True, fastmath=True)(_step_underdamped)
+
+def _step_response(t: np.ndarray, static: float, omega_n: float, zeta: float) -> np.ndarray:
+    """Displacement of a single-DOF system under a step load with static deflection `static`"""
+    # Keep the scalars in the grid's precision so NumPy does not upcast the samples
+    omega_n = t.dtype.type(omega_n)
+    static = t.dtype.type(static)
+    if zeta < 1:
+        # Underdamped: evaluated in a single compiled or fused pass where numba or
+        # numexpr is available, otherwise with in-place NumPy operations on two buffers
+        omega_d = t.dtype.type(omega_n * np.sqrt(1 - zeta**2))
+        decay = t.dtype.type(zeta * omega_n)
+        if _HAS_NUMBA:
+            response = np.empty_like(t)
+            _step_underdamped(t, static, zeta, omega_n, omega_d, response)
+            return response
+        if _HAS_NUMEXPR:
+            return ne.evaluate(
+                "static*(1 - exp(-decay*t)*(cos(omega_d*t) + (decay/omega_d)*sin(omega_d*t)))",
+                local_dict={'t': t, 'static': static, 'omega_d': omega_d, 'decay': decay}
+            )
+        wt = omega_d * t
+        response = np.sin(wt)
+        response *= decay / omega_d
+        response += np.cos(wt, out=wt)
+        response *= np.exp(np.multiply(t, -decay, out=wt), out=wt)
+        np.subtract(1, response, out=response)
+        response *= static
+        return response
+    
+    # Critically damped or overdamped
+    return static * (1 - np.exp(-omega_n * t) * (1 + omega_n * t))
+
+@dataclass(frozen=True, slots=True)
 class MaterialProperties:
     # Basic material properties
     E_axial: float  # Young's modulus in axial direction (GPa)
@@ -16,44 +85,48 @@ class MaterialProperties:
     # Damping properties
     damping_ratio: float  # Damping ratio (ζ)
     
+    # Moduli in Pa for internal calculations, derived from the GPa inputs
+    E_axial_Pa: float = field(init=False, repr=False)
+    E_transverse_Pa: float = field(init=False, repr=False)
+    G_Pa: float = field(init=False, repr=False)
+    
     def __post_init__(self):
-        # Convert GPa to Pa for internal calculations
-        self.E_axial *= 1e9
-        self.E_transverse *= 1e9
-        self.G *= 1e9
+        # The inputs are left untouched, so re-running the conversion (e.g. via
+        # dataclasses.replace) cannot scale them twice
+        object.__setattr__(self, 'E_axial_Pa', self.E_axial * 1e9)
+        object.__setattr__(self, 'E_transverse_Pa', self.E_transverse * 1e9)
+        object.__setattr__(self, 'G_Pa', self.G * 1e9)
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ForkGeometry:
     length: float  # Length of fork (m)
     outer_diameter: float  # Outer diameter (m)
     wall_thickness: float  # Wall thickness (m)
     
-    @property
-    def inner_diameter(self) -> float:
-        return self.outer_diameter - 2 * self.wall_thickness
+    # Derived section properties, computed once from the dimensions above
+    inner_diameter: float = field(init=False, repr=False)  # Inner diameter (m)
+    cross_sectional_area: float = field(init=False, repr=False)  # Cross-sectional area (m²)
+    moment_of_inertia: float = field(init=False, repr=False)  # Second moment of area (m⁴)
+    volume: float = field(init=False, repr=False)  # Material volume (m³)
     
-    @property
-    def cross_sectional_area(self) -> float:
-        return np.pi * (self.outer_diameter**2 - self.inner_diameter**2) / 4
-    
-    @property
-    def moment_of_inertia(self) -> float:
-        return np.pi * (self.outer_diameter**4 - self.inner_diameter**4) / 64
-    
-    @property
-    def volume(self) -> float:
-        return self.cross_sectional_area * self.length
+    def __post_init__(self):
+        inner_diameter = self.outer_diameter - 2 * self.wall_thickness
+        area = np.pi * (self.outer_diameter**2 - inner_diameter**2) / 4
+        object.__setattr__(self, 'inner_diameter', inner_diameter)
+        object.__setattr__(self, 'cross_sectional_area', area)
+        object.__setattr__(self, 'moment_of_inertia', np.pi * (self.outer_diameter**4 - inner_diameter**4) / 64)
+        object.__setattr__(self, 'volume', area * self.length)
 
 class ForkSimulation:
     def __init__(self, material: MaterialProperties, geometry: ForkGeometry):
         self.material = material
         self.geometry = geometry
         
-    @property
+    @cached_property
     def mass(self) -> float:
         return self.geometry.volume * self.material.rho
     
-    @property
+    @cached_property
     def cost(self) -> float:
         return self.mass * self.material.cost_per_kg
     
@@ -70,7 +143,7 @@ class ForkSimulation:
         """Calculate natural frequency for given mode"""
         # Using Euler-Bernoulli beam theory
         L = self.geometry.length
-        E = self.material.E_axial
+        E = self.material.E_axial_Pa
         I = self.geometry.moment_of_inertia
         m = self.mass / L  # mass per unit length
         rho = self.material.rho
@@ -84,7 +157,7 @@ class ForkSimulation:
         """Calculate natural frequency for given mode"""
         # Using Euler-Bernoulli beam theory
         L = self.geometry.length
-        E = self.material.E_axial
+        E = self.material.E_axial_Pa
         I = self.geometry.moment_of_inertia
         m = self.mass / L  # mass per unit length
         
@@ -93,104 +166,233 @@ class ForkSimulation:
         
         return (beta_L**2 / (2 * np.pi * L**2)) * np.sqrt(E * I / m)
     
+    # Derived constants, computed once per simulation (the material and geometry
+    # are frozen, so they cannot change after construction)
+    @cached_property
     def damping_coefficient(self) -> float:
-        """Calculate damping coefficient"""
-        return 2 * self.material.damping_ratio * np.sqrt(self.material.E_axial * self.geometry.moment_of_inertia * self.mass)
+        """Damping coefficient (Ns/m)"""
+        return 2 * self.material.damping_ratio * np.sqrt(self.material.E_axial_Pa * self.geometry.moment_of_inertia * self.mass)
     
-    def plot_stress_distribution(self, axial_force: float, transverse_force: float):
-        """Plot stress distribution along the fork"""
-        x = np.linspace(0, self.geometry.length, 100)
-        axial_stress = np.full_like(x, self.axial_stress(axial_force))
-        bending_stress = self.bending_stress(transverse_force, x)
-        total_stress = axial_stress + bending_stress
+    @cached_property
+    def _k(self) -> float:
+        """Bending stiffness E*I/L^3"""
+        return self.material.E_axial_Pa * self.geometry.moment_of_inertia / self.geometry.length**3
+    
+    def stress_distribution(self, axial_force: float, transverse_force: float) -> Tuple[np.ndarray, ...]:
+        """Axial, bending and total stress (Pa) along the fork, with the positions (m)"""
+        x = np.linspace(0, self.geometry.length, 100, dtype=_PLOT_DTYPE)
         
-        plt.figure(figsize=(10, 6))
-        plt.plot(x, axial_stress/1e6, label='Axial Stress')
-        plt.plot(x, bending_stress/1e6, label='Bending Stress')
-        plt.plot(x, total_stress/1e6, label='Total Stress')
-        plt.xlabel('Distance from base (m)')
-        plt.ylabel('Stress (MPa)')
-        plt.title('Stress Distribution Along Seat Post ')
-        plt.legend()
-        plt.grid(True)
-        plt.show()
+        # Axial stress is uniform and bending stress linear in x, so only two
+        # arrays are computed; the axial "array" is a broadcast view of the scalar
+        sigma_a = _PLOT_DTYPE(self.axial_stress(axial_force))
+        coef = _PLOT_DTYPE(transverse_force * self.geometry.outer_diameter / (2 * self.geometry.moment_of_inertia))
+        bending_stress = coef * x
+        total_stress = bending_stress + sigma_a
+        return x, np.broadcast_to(sigma_a, x.shape), bending_stress, total_stress
     
-    def plot_frequency_response(self, force_amplitude: float, frequency_range: Tuple[float, float]):
-        """Plot frequency response of the fork"""
-        freq = np.linspace(frequency_range[0], frequency_range[1], 1000)
-        omega = 2 * np.pi * freq
-        omega_n = 2 * np.pi * self.natural_frequency()
-        c = self.damping_coefficient()
-        k = self.material.E_axial * self.geometry.moment_of_inertia / self.geometry.length**3
+    def stress_tensor_field(self, axial_force: float, transverse_force: float,
+                            x: np.ndarray) -> np.ndarray:
+        """
+        Cauchy stress tensor (Pa) at the outer fibre for each position along the fork
         
-        # Frequency response function
-        H = 1 / (k - self.mass * omega**2 + 1j * c * omega)
-        response = np.abs(H) * force_amplitude
+        Args:
+            axial_force: Axial force (N)
+            transverse_force: Transverse force (N)
+            x: Distances from the base (m)
         
-        plt.figure(figsize=(10, 6))
-        plt.plot(freq, response * 1000)  # Convert to mm
-        plt.xlabel('Frequency (Hz)')
-        plt.ylabel('Amplitude (mm)')
-        plt.title('Frequency Response')
-        plt.grid(True)
-        plt.show()
+        Returns:
+            Array of shape (len(x), 3, 3), axis 0 being the fork axis
+        """
+        x = np.asarray(x, dtype=np.float64)
+        sigma_a = self.axial_stress(axial_force)
+        coef = transverse_force * self.geometry.outer_diameter / (2 * self.geometry.moment_of_inertia)
+        
+        # Transverse shear vanishes at the outer fibre, so the state is uniaxial;
+        # the tensor is preallocated and filled in one vectorised pass
+        out = np.zeros((x.shape[0], 3, 3))
+        np.multiply(x, coef, out=out[:, 0, 0])
+        out[:, 0, 0] += sigma_a
+        return out
+    
+    def plot_stress_distribution(self, axial_force: float, transverse_force: float,
+                                 ax: Optional['Axes'] = None) -> list:
+        """
+        Plot stress distribution along the fork
+        
+        Draws into ax if given (without showing), otherwise in a new window.
+        Returns the axial, bending and total stress lines.
+        """
+        x, axial_stress, bending_stress, total_stress = self.stress_distribution(axial_force, transverse_force)
+        
+        show = ax is None
+        if show:
+            plt = _pyplot()
+            ax = plt.figure(figsize=(10, 6)).gca()
+        lines = [
+            *ax.plot(x, axial_stress/1e6, label='Axial Stress'),
+            *ax.plot(x, bending_stress/1e6, label='Bending Stress'),
+            *ax.plot(x, total_stress/1e6, label='Total Stress')
+        ]
+        ax.set_xlabel('Distance from base (m)')
+        ax.set_ylabel('Stress (MPa)')
+        ax.set_title('Stress Distribution Along Seat Post ')
+        ax.legend()
+        ax.grid(True)
+        if show:
+            plt.show()
+        return lines
+    
+    def _frf_denominator(self, omega):
+        """
+        Real and imaginary parts (a, b) of k - m*omega^2 + i*c*omega, the inverse of the
+        frequency response function H(omega), in the precision of omega
+        """
+        dtype = np.asarray(omega).dtype.type
+        a = dtype(self._k) - dtype(self.mass) * omega * omega
+        b = dtype(self.damping_coefficient) * omega
+        return a, b
+    
+    def _frf_magnitude(self, omega):
+        """|H(omega)| = 1 / sqrt(a^2 + b^2), evaluated without complex arithmetic"""
+        return 1 / np.hypot(*self._frf_denominator(omega))
+    
+    def frequency_response(self, force_amplitude: float,
+                           frequency_range: Tuple[float, float]) -> Tuple[np.ndarray, np.ndarray]:
+        """Frequencies (Hz) and response amplitude (m) over the given range"""
+        # Sweep in angular frequency, with the frequencies in Hz derived for the x-axis
+        omega = np.linspace(2 * np.pi * frequency_range[0], 2 * np.pi * frequency_range[1], 1000,
+                            dtype=_PLOT_DTYPE)
+        freq = omega * _PLOT_DTYPE(0.5 / np.pi)
+        
+        # Only the magnitude of the frequency response function is needed here
+        response = self._frf_magnitude(omega)
+        response *= _PLOT_DTYPE(force_amplitude)
+        return freq, response
+    
+    def plot_frequency_response(self, force_amplitude: float, frequency_range: Tuple[float, float],
+                                ax: Optional['Axes'] = None) -> list:
+        """
+        Plot frequency response of the fork
+        
+        Draws into ax if given (without showing), otherwise in a new window.
+        Returns the response line.
+        """
+        freq, response = self.frequency_response(force_amplitude, frequency_range)
+        
+        show = ax is None
+        if show:
+            plt = _pyplot()
+            ax = plt.figure(figsize=(10, 6)).gca()
+        lines = ax.plot(freq, response * 1000)  # Convert to mm
+        ax.set_xlabel('Frequency (Hz)')
+        ax.set_ylabel('Amplitude (mm)')
+        ax.set_title('Frequency Response')
+        ax.grid(True)
+        if show:
+            plt.show()
+        return lines
 
-    def plot_axial_frequency_response(self, force_amplitude: float):
+    def plot_axial_frequency_response(self, force_amplitude: float,
+                                      ax: Optional['Axes'] = None) -> list:
+        """
+        Plot frequency response of the fork to an axial force
+        
+        Draws into ax if given (without showing), otherwise in a new window.
+        Returns the response line.
+        """
 
         # Physical parameters
-        E = self.material.E_axial        # Young's modulus in Pascals (e.g., carbon fibre)
+        E = self.material.E_axial_Pa        # Young's modulus in Pascals (e.g., carbon fibre)
         rho = self.material.rho             # Density in kg/m^3
         L = self.geometry.length                # Length of the cylinder in meters
         A = self.geometry.cross_sectional_area            # Cross-sectional area in m^2
-        c = self.damping_coefficient()               # Damping coefficient in Ns/m
+        c = self.damping_coefficient               # Damping coefficient in Ns/m
         F0 = force_amplitude              # Amplitude of axial force in N
 
         # Derived quantities
-        k = E * A / L          # Axial stiffness
-        m = rho * A * L        # Mass
+        k = _PLOT_DTYPE(E * A / L)          # Axial stiffness
+        m = _PLOT_DTYPE(rho * A * L)        # Mass
+        c = _PLOT_DTYPE(c)
+        F0 = _PLOT_DTYPE(F0)
         f_n = self.natural_frequency()
 
         zeta = self.material.damping_ratio
         f_d = f_n * np.sqrt(1 - zeta**2)         # Damped natural frequency (Hz)
 
         # Frequency range
-        frequencies = np.linspace(0.1, 2 * f_n[0], 500)
-        omega = 2 * np.pi * frequencies
+        omega = np.linspace(2 * np.pi * 0.1, 4 * np.pi * f_n[0], 500, dtype=_PLOT_DTYPE)
+        frequencies = omega * _PLOT_DTYPE(0.5 / np.pi)
 
         # Displacement response amplitude |X(omega)|
         X_mag = F0 / np.sqrt((k - m * omega**2)**2 + (c * omega)**2)
 
         # Plotting the frequency response
-        plt.figure(figsize=(10, 5))
-        plt.plot(frequencies, X_mag)
-        #plt.axvline(f_n, color='r', linestyle='--', label=f'Mode 1 Natural Resonance: {f_n[0]:.2f} Hz')
-        #plt.axvline(f_d, color='g', linestyle='--', label=f'Mode 1 Damped Resonance: {f_d[0]:.2f} Hz')
-        plt.title('Frequency Response to Axial Vibration')
-        plt.xlabel('Frequency (Hz)')
-        plt.ylabel('Displacement Amplitude (m/N)')
-        plt.grid(True)
-        plt.legend()
-        plt.tight_layout()
-        plt.show()
+        show = ax is None
+        if show:
+            plt = _pyplot()
+            ax = plt.figure(figsize=(10, 5)).gca()
+        lines = ax.plot(frequencies, X_mag)
+        #ax.axvline(f_n, color='r', linestyle='--', label=f'Mode 1 Natural Resonance: {f_n[0]:.2f} Hz')
+        #ax.axvline(f_d, color='g', linestyle='--', label=f'Mode 1 Damped Resonance: {f_d[0]:.2f} Hz')
+        ax.set_title('Frequency Response to Axial Vibration')
+        ax.set_xlabel('Frequency (Hz)')
+        ax.set_ylabel('Displacement Amplitude (m/N)')
+        ax.grid(True)
+        ax.legend()
+        if show:
+            plt.tight_layout()
+            plt.show()
+        return lines
 
 
-    def plot_steady_state_vibration(self, force_amplitude: float, frequency: float, duration: float = 2.0):
-        """Plot steady-state vibration response to a sinusoidal force"""
-        t = np.linspace(0, duration, 1000)
+    def steady_state_vibration(self, force_amplitude: float, frequency: float,
+                               duration: float = 2.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Time (s), sinusoidal input force (N) and steady-state displacement (m)"""
+        t = np.linspace(0, duration, 1000, dtype=_PLOT_DTYPE)
         omega = 2 * np.pi * frequency
-        omega_n = 2 * np.pi * self.natural_frequency()
-        c = self.damping_coefficient()
-        k = self.material.E_axial * self.geometry.moment_of_inertia / self.geometry.length**3
         
-        # Steady-state response
-        H = 1 / (k - self.mass * omega**2 + 1j * c * omega)
-        phase = np.angle(H)
-        amplitude = np.abs(H) * force_amplitude
+        # Steady-state response (the FRF itself in double precision); the phase of
+        # 1 / (a + ib) is atan2(-b, a)
+        a, b = self._frf_denominator(omega)
+        phase = _PLOT_DTYPE(np.arctan2(-b, a))
+        amplitude = _PLOT_DTYPE(force_amplitude / np.hypot(a, b))
+        omega = _PLOT_DTYPE(omega)
+        force_amplitude = _PLOT_DTYPE(force_amplitude)
         
         # Input force and response
-        force = force_amplitude * np.sin(omega * t)
-        response = amplitude * np.sin(omega * t + phase)
+        if _HAS_NUMEXPR:
+            force = ne.evaluate("force_amplitude*sin(omega*t)")
+            response = ne.evaluate("amplitude*sin(omega*t + phase)")
+        else:
+            wt = omega * t
+            force = np.sin(wt)
+            force *= force_amplitude
+            wt += phase
+            response = np.sin(wt, out=wt)
+            response *= amplitude
+        return t, force, response
+    
+    def plot_steady_state_vibration(self, force_amplitude: float, frequency: float, duration: float = 2.0,
+                                    ax: Optional['Axes'] = None) -> list:
+        """
+        Plot steady-state vibration response to a sinusoidal force
+        
+        With ax given, only the displacement response is drawn into it (without
+        showing); otherwise the input force and response open in a new window.
+        Returns the response line.
+        """
+        t, force, response = self.steady_state_vibration(force_amplitude, frequency, duration)
+        
+        if ax is not None:
+            lines = ax.plot(t, response * 1000, label='Response')  # Convert to mm
+            ax.set_xlabel('Time (s)')
+            ax.set_ylabel('Displacement (mm)')
+            ax.set_title('Steady-State Response')
+            ax.grid(True)
+            ax.legend()
+            return lines
         
+        plt = _pyplot()
         plt.figure(figsize=(12, 8))
         plt.subplot(2, 1, 1)
         plt.plot(t, force, label='Input Force')
@@ -201,7 +403,7 @@ class ForkSimulation:
         plt.legend()
         
         plt.subplot(2, 1, 2)
-        plt.plot(t, response * 1000, label='Response')  # Convert to mm
+        lines = plt.plot(t, response * 1000, label='Response')  # Convert to mm
         plt.xlabel('Time (s)')
         plt.ylabel('Displacement (mm)')
         plt.title('Steady-State Response')
@@ -209,56 +411,63 @@ class ForkSimulation:
         plt.legend()
         plt.tight_layout()
         plt.show()
+        return lines
 
-    def plot_flex_step_response(self, force_amplitude: float, duration: float = 2.0):
-        """Plot step response of the fork to a sudden force application"""
-        t = np.linspace(0, duration, 1000)
+    def plot_flex_step_response(self, force_amplitude: float, duration: float = 2.0,
+                                ax: Optional['Axes'] = None) -> list:
+        """
+        Plot step response of the fork to a sudden force application
+        
+        Draws into ax if given (without showing), otherwise in a new window.
+        Returns the response line.
+        """
+        t = np.linspace(0, duration, 1000, dtype=_PLOT_DTYPE)
         omega_n = 2 * np.pi * self.flexural_natural_frequency()
         zeta = self.material.damping_ratio
-        c = self.damping_coefficient()
-        k = self.material.E_axial * self.geometry.moment_of_inertia / self.geometry.length**3
+        k = self._k
         
-        # Step response for underdamped system (zeta < 1)
-        if zeta < 1:
-            omega_d = omega_n * np.sqrt(1 - zeta**2)
-            response = (force_amplitude/k) * (1 - np.exp(-zeta * omega_n * t) * 
-                    (np.cos(omega_d * t) + (zeta * omega_n/omega_d) * np.sin(omega_d * t)))
-        else:
-            # Critically damped or overdamped
-            response = (force_amplitude/k) * (1 - np.exp(-omega_n * t) * (1 + omega_n * t))
+        response = _step_response(t, force_amplitude/k, omega_n, zeta)
         
-        plt.figure(figsize=(10, 6))
-        plt.plot(t, response * 1000)  # Convert to mm
-        plt.xlabel('Time (s)')
-        plt.ylabel('Displacement (mm)')
-        plt.title('Step Response')
-        plt.grid(True)
-        plt.show()
+        show = ax is None
+        if show:
+            plt = _pyplot()
+            ax = plt.figure(figsize=(10, 6)).gca()
+        lines = ax.plot(t, response * 1000)  # Convert to mm
+        ax.set_xlabel('Time (s)')
+        ax.set_ylabel('Displacement (mm)')
+        ax.set_title('Step Response')
+        ax.grid(True)
+        if show:
+            plt.show()
+        return lines
 
-    def plot_step_response(self, force_amplitude: float, duration: float = 2.0):
-        """Plot step response of the fork to a sudden force application"""
-        t = np.linspace(0, duration, 1000)
-        omega_n = 2 * np.pi * self.natural_frequency()
+    def plot_step_response(self, force_amplitude: float, duration: float = 2.0,
+                           ax: Optional['Axes'] = None) -> list:
+        """
+        Plot step response of the fork to a sudden force application
+        
+        Draws into ax if given (without showing), otherwise in a new window.
+        Returns the response line.
+        """
+        t = np.linspace(0, duration, 1000, dtype=_PLOT_DTYPE)
+        omega_n = 2 * np.pi * self.natural_frequency()[0]
         zeta = self.material.damping_ratio
-        c = self.damping_coefficient()
-        k = self.material.E_axial * self.geometry.moment_of_inertia / self.geometry.length**3
+        k = self._k
         
-        # Step response for underdamped system (zeta < 1)
-        if zeta < 1:
-            omega_d = omega_n * np.sqrt(1 - zeta**2)
-            response = (force_amplitude/k) * (1 - np.exp(-zeta * omega_n * t) * 
-                    (np.cos(omega_d * t) + (zeta * omega_n/omega_d) * np.sin(omega_d * t)))
-        else:
-            # Critically damped or overdamped
-            response = (force_amplitude/k) * (1 - np.exp(-omega_n * t) * (1 + omega_n * t))
+        response = _step_response(t, force_amplitude/k, omega_n, zeta)
         
-        plt.figure(figsize=(10, 6))
-        plt.plot(t, response * 1000)  # Convert to mm
-        plt.xlabel('Time (s)')
-        plt.ylabel('Displacement (mm)')
-        plt.title('Step Response')
-        plt.grid(True)
-        plt.show()
+        show = ax is None
+        if show:
+            plt = _pyplot()
+            ax = plt.figure(figsize=(10, 6)).gca()
+        lines = ax.plot(t, response * 1000)  # Convert to mm
+        ax.set_xlabel('Time (s)')
+        ax.set_ylabel('Displacement (mm)')
+        ax.set_title('Step Response')
+        ax.grid(True)
+        if show:
+            plt.show()
+        return lines
 
 '''# Example usage
 if __name__ == "__main__":
@@ -1,5 +1,8 @@
 import subprocess
 import os
+import codecs
+import locale
+import selectors
 import sys
 from pathlib import Path
 import json
@@ -27,73 +30,93 @@ class CCSMRunner:
         env = os.environ.copy()
         env['WINEDEBUG'] = '-all'  # Suppress Wine debug output
         
-        try:
-            # Run the command
-            start_time = time.time()
-            process = subprocess.Popen(
-                cmd,
-                cwd=self.working_dir,
-                env=env,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            
-            # Log the command
-            with open(self.log_file, 'a') as f:
-                f.write(f"\n{'='*50}\n")
-                f.write(f"Command: {' '.join(cmd)}\n")
-                f.write(f"Started at: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"{'='*50}\n")
-            
-            # Stream output to both console and log file
-            while True:
-                output = process.stdout.readline()
-                if output == '' and process.poll() is not None:
-                    break
-                if output:
-                    print(output.strip())
-                    with open(self.log_file, 'a') as f:
-                        f.write(output)
-                        
-            # Get any remaining output
-            stdout, stderr = process.communicate(timeout=timeout)
-            
-            # Log completion
-            end_time = time.time()
-            with open(self.log_file, 'a') as f:
-                f.write(f"\n{'='*50}\n")
-                f.write(f"Completed at: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Duration: {end_time - start_time:.2f} seconds\n")
-                f.write(f"Exit code: {process.returncode}\n")
+        # Keep one line-buffered log handle open for the whole run
+        with open(self.log_file, 'a', buffering=1) as log:
+            try:
+                # Run the command
+                start_time = time.time()
+                process = subprocess.Popen(
+                    cmd,
+                    cwd=self.working_dir,
+                    env=env,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    bufsize=0  # Pipes are drained with os.read, so skip Python's buffering
+                )
+                
+                # Log the command
+                log.write(f"\n{'='*50}\n")
+                log.write(f"Command: {' '.join(cmd)}\n")
+                log.write(f"Started at: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+                log.write(f"{'='*50}\n")
+                
+                # Drain stdout and stderr together in 64 KB chunks until both
+                # pipes close, streaming stdout to the console and log file
+                deadline = start_time + timeout
+                encoding = locale.getpreferredencoding(False)
+                out_fd = process.stdout.fileno()
+                decoders = {
+                    fd: codecs.getincrementaldecoder(encoding)('replace')
+                    for fd in (out_fd, process.stderr.fileno())
+                }
+                chunks = {fd: [] for fd in decoders}
+                with selectors.DefaultSelector() as sel:
+                    sel.register(process.stdout, selectors.EVENT_READ)
+                    sel.register(process.stderr, selectors.EVENT_READ)
+                    while sel.get_map():
+                        remaining = deadline - time.time()
+                        if remaining <= 0:
+                            raise subprocess.TimeoutExpired(cmd, timeout)
+                        for key, _ in sel.select(timeout=remaining):
+                            data = os.read(key.fd, 65536)
+                            if not data:
+                                sel.unregister(key.fileobj)
+                                continue
+                            text = decoders[key.fd].decode(data)
+                            chunks[key.fd].append(text)
+                            if key.fd == out_fd:
+                                sys.stdout.write(text)
+                                log.write(text)
+                
+                process.stdout.close()
+                process.stderr.close()
+                stdout, stderr = (''.join(chunks[fd]) + dec.decode(b'', final=True)
+                                  for fd, dec in decoders.items())
+                process.wait(timeout=max(deadline - time.time(), 0.1))
+                
+                # Log completion
+                end_time = time.time()
+                log.write(f"\n{'='*50}\n")
+                log.write(f"Completed at: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+                log.write(f"Duration: {end_time - start_time:.2f} seconds\n")
+                log.write(f"Exit code: {process.returncode}\n")
                 if stderr:
-                    f.write(f"Errors:\n{stderr}\n")
-                f.write(f"{'='*50}\n")
-            
-            return {
-                'success': process.returncode == 0,
-                'exit_code': process.returncode,
-                'stdout': stdout,
-                'stderr': stderr,
-                'duration': end_time - start_time
-            }
-            
-        except subprocess.TimeoutExpired:
-            process.kill()
-            with open(self.log_file, 'a') as f:
-                f.write(f"\nProcess timed out after {timeout} seconds\n")
-            return {
-                'success': False,
-                'error': f'Process timed out after {timeout} seconds'
-            }
-            
-        except Exception as e:
-            with open(self.log_file, 'a') as f:
-                f.write(f"\nError: {str(e)}\n")
-            return {
-                'success': False,
-                'error': str(e)
-            }
+                    log.write(f"Errors:\n{stderr}\n")
+                log.write(f"{'='*50}\n")
+                
+                return {
+                    'success': process.returncode == 0,
+                    'exit_code': process.returncode,
+                    'stdout': stdout,
+                    'stderr': stderr,
+                    'duration': end_time - start_time
+                }
+                
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.communicate()
+                log.write(f"\nProcess timed out after {timeout} seconds\n")
+                return {
+                    'success': False,
+                    'error': f'Process timed out after {timeout} seconds'
+                }
+                
+            except Exception as e:
+                log.write(f"\nError: {str(e)}\n")
+                return {
+                    'success': False,
+                    'error': str(e)
+                }
 
 def main():
     if len(sys.argv) < 2:
@@ -0,0 +1,101 @@
+'''
+Test of CompositeAnalysis
+=========================
+
+Test the stress, strain and failure calculations of Archive/composite_analysis.py
+against unidirectional laminates, whose ply stresses follow directly from the load,
+and the batch calculation against one load case at a time.
+'''
+
+import os
+import sys
+
+import pytest
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'Archive'))
+
+import composite_analysis
+from composite_analysis import PlyProperties, CompositeAnalysis, create_symmetric_layup
+
+
+H = 0.4e-3  # Total thickness of the test laminates (m)
+NX = 300e3  # Axial force resultant, giving 750 MPa in the plies (N/m)
+
+
+def unidirectional(angle):
+    '''Four 0.1 mm plies of the same material at one angle'''
+    ply = PlyProperties(E11=138, E22=9, nu12=0.3, G12=6.9, thickness=0.1, orientation=angle)
+    return CompositeAnalysis([ply] * 4)
+
+
+@pytest.fixture
+def quasi_isotropic():
+    ply = PlyProperties(E11=138, E22=9, nu12=0.3, G12=6.9, thickness=0.125, orientation=0)
+    return create_symmetric_layup(ply, [0, 45, -45, 90])
+
+
+def test_unidirectional_stress():
+    '''Under Nx alone every ply of a UD laminate carries sigma_x = Nx/h'''
+    result = unidirectional(0).calculate_stress_strain({'Nx': NX})
+    stress_reference = np.tile([NX / H, 0, 0], (4, 1))
+    np.testing.assert_allclose(result['stresses'], stress_reference, atol=1e-3)
+    strain_reference = np.tile([NX / H / 138e9, -0.3 * NX / H / 138e9, 0], (4, 1))
+    np.testing.assert_allclose(result['strains'], strain_reference, rtol=1e-12, atol=1e-18)
+
+
+@pytest.mark.parametrize('criterion, reference', [
+    ('tsai_hill', 0.25),  # (750/1500)^2
+    ('max_stress', 0.5),  # 750/1500
+    ('max_strain', 0.5)   # the fibre strain governs: eps1*E11/Xt = 750/1500
+])
+def test_unidirectional_failure_0(criterion, reference):
+    failure = unidirectional(0).calculate_failure({'Nx': NX}, criterion)
+    np.testing.assert_allclose(failure['failure_indices'], reference)
+    assert failure['failed_plies'] == []
+
+
+def test_unidirectional_failure_90():
+    '''Nx loads 90 degree plies transversely: (sigma_2/Yt)^2 = (750/40)^2'''
+    failure = unidirectional(90).calculate_failure({'Nx': NX})
+    np.testing.assert_allclose(failure['failure_indices'], (750 / 40)**2)
+    assert failure['failed_plies'] == [0, 1, 2, 3]
+
+
+def test_batch_matches_single(quasi_isotropic):
+    rng = np.random.default_rng(0)
+    N = rng.normal(scale=1e4, size=(5, 3))
+    M = rng.normal(scale=10, size=(5, 3))
+    batch = quasi_isotropic.calculate_stress_strain_batch(N, M)
+
+    for i in range(5):
+        loads = dict(zip(('Nx', 'Ny', 'Nxy', 'Mx', 'My', 'Mxy'), np.concatenate((N[i], M[i]))))
+        single = quasi_isotropic.calculate_stress_strain(loads)
+        np.testing.assert_allclose(batch['stresses'][:, :, i], single['stresses'])
+        np.testing.assert_allclose(batch['strains'][:, :, i], single['strains'])
+
+
+def test_from_arrays_matches_plies(quasi_isotropic):
+    plies = quasi_isotropic.plies
+    columns = np.array([[ply.E11, ply.E22, ply.nu12, ply.G12, ply.thickness, ply.orientation]
+                        for ply in plies]).T
+    layup = CompositeAnalysis.from_arrays(*columns)
+    assert layup.plies == plies
+    loads = {'Nx': 1000, 'Mxy': 2}
+    np.testing.assert_allclose(layup.calculate_stress_strain(loads)['stresses'],
+                               quasi_isotropic.calculate_stress_strain(loads)['stresses'])
+
+
+def test_cached_results_are_read_only(quasi_isotropic):
+    result = quasi_isotropic.calculate_stress_strain({'Nx': 1000})
+    with pytest.raises(ValueError):
+        result['stresses'][:] = 0
+
+
+def test_stress_cache_is_bounded(quasi_isotropic):
+    first = quasi_isotropic.calculate_stress_strain({'Nx': 0})
+    for Nx in range(1, 3 * composite_analysis._STRESS_CACHE_SIZE):
+        quasi_isotropic.calculate_stress_strain({'Nx': Nx})
+        quasi_isotropic.calculate_stress_strain({'Nx': 0})  # Kept as the most recently used
+    assert len(quasi_isotropic._stress_strain_cache) == composite_analysis._STRESS_CACHE_SIZE
+    assert quasi_isotropic.calculate_stress_strain({'Nx': 0})['stresses'] is first['stresses']
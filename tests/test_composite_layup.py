@@ -0,0 +1,109 @@
+'''
+Test of CompositeLayup
+======================
+
+Test the batched ABD calculation and the single-call CLT of composite_layup.py
+against building each layup as a CompositeLayup, with and without Numba.
+'''
+
+import pytest
+import numpy as np
+
+import composite_layup
+from composite_layup import PlyProperties, CompositeLayup, clt_effective_properties
+
+
+@pytest.fixture(params=[True, False], ids=['numba', 'numpy'])
+def numba_enabled(request, monkeypatch):
+    '''Run a test with the compiled kernels and with the NumPy fallbacks'''
+    if request.param and not composite_layup._HAS_NUMBA:
+        pytest.skip('numba is not installed')
+    monkeypatch.setattr(composite_layup, '_HAS_NUMBA', request.param)
+    return request.param
+
+
+@pytest.fixture
+def material():
+    return PlyProperties(E11=138, E22=9, nu12=0.3, G12=6.9, thickness=0.125, orientation=0)
+
+
+@pytest.fixture
+def candidates():
+    rng = np.random.default_rng(1)
+    theta = rng.choice([0., 45., -45., 90.], size=(6, 8))
+    thickness = rng.uniform(0.1e-3, 0.2e-3, size=(6, 8))
+    return theta, thickness
+
+
+def ply_arrays(material, theta, thickness):
+    E11, E22, nu12, G12, _, _ = material.in_SI()
+    return dict(E11=np.full_like(theta, E11), E22=np.full_like(theta, E22),
+                nu12=np.full_like(theta, nu12), G12=np.full_like(theta, G12),
+                thickness=thickness, orientation=theta)
+
+
+def layup_ABD(material, theta, thickness):
+    return CompositeLayup(**ply_arrays(material, theta, thickness)).calculate_ABD_matrices()
+
+
+def test_batch_abd_matches_single(numba_enabled, material, candidates):
+    theta, thickness = candidates
+    batch = CompositeLayup.batch_abd(theta, thickness, material)
+    assert all(M.dtype == np.float64 for M in batch)
+
+    for c in range(theta.shape[0]):
+        for M, M_reference in zip(batch, layup_ABD(material, theta[c], thickness[c])):
+            np.testing.assert_allclose(M[c], M_reference, rtol=1e-10, atol=1e-12)
+
+
+def test_batch_abd_float32(material, candidates):
+    theta, thickness = candidates
+    batch = CompositeLayup.batch_abd(theta, thickness, material, dtype=np.float32)
+    reference = CompositeLayup.batch_abd(theta, thickness, material)
+    for M, M_reference in zip(batch, reference):
+        assert M.dtype == np.float32
+        scale = np.abs(M_reference).max(axis=(1, 2), keepdims=True)
+        np.testing.assert_allclose(M / scale, M_reference / scale, atol=1e-5)
+
+
+def test_ABD_matrices_are_read_only(material):
+    theta = np.array([0., 45., -45., 90.])
+    A, B, D = layup_ABD(material, theta, np.full(4, 0.125e-3))
+    with pytest.raises(ValueError):
+        A *= 2
+
+
+@pytest.fixture(params=[True, False], ids=['numba', 'python'])
+def clt(request, monkeypatch):
+    '''Run clt_effective_properties with the compiled kernel and as plain Python'''
+    if request.param:
+        if not composite_layup._HAS_NUMBA:
+            pytest.skip('numba is not installed')
+    elif composite_layup._HAS_NUMBA:
+        monkeypatch.setattr(composite_layup, '_clt_kernel', composite_layup._clt_kernel.py_func)
+    return clt_effective_properties
+
+
+@pytest.mark.parametrize('theta', [
+    [0., 45., -45., 90., 90., -45., 45., 0.],  # symmetric: B is zero
+    [0., 30., 60., 90.],                       # unsymmetric
+], ids=['symmetric', 'unsymmetric'])
+def test_clt_matches_layup(clt, material, theta):
+    theta = np.array(theta)
+    arrays = ply_arrays(material, theta, np.full(theta.shape, 0.125e-3))
+    layup = CompositeLayup(**arrays)
+    ABD, properties = clt(**arrays)
+
+    A, B, D = layup.calculate_ABD_matrices()
+    np.testing.assert_allclose(ABD, np.block([[A, B], [B, D]]), rtol=1e-10, atol=1e-9)
+    for key, value in properties.items():
+        np.testing.assert_allclose(value, layup.calculate_effective_properties()[key], rtol=1e-9)
+
+
+def test_clt_unidirectional(clt, material):
+    '''A UD 0 degree laminate has the ply's own elastic constants'''
+    theta = np.zeros(4)
+    _, properties = clt(**ply_arrays(material, theta, np.full(4, 0.125e-3)))
+    np.testing.assert_allclose([properties['E_x'], properties['E_y'], properties['nu_xy'],
+                                properties['G_xy'], properties['thickness']],
+                               [138, 9, 0.3, 6.9, 0.5], rtol=1e-10)
@@ -0,0 +1,133 @@
+'''
+Test of CustomLayup
+===================
+
+Test the incremental and batched calculations of custom_composite.py against
+building and evaluating each layup from scratch, with and without Numba.
+'''
+
+import pytest
+import numpy as np
+
+import custom_composite
+from custom_composite import MaterialType, PlyProperties, CustomLayup, evaluate_layups_batch
+
+
+LOADS = np.array([[1000., -200.],   # Nx
+                  [0., 300.],       # Ny
+                  [50., 0.],        # Nxy
+                  [2., 0.],         # Mx
+                  [0., -1.],        # My
+                  [0.5, 0.]])       # Mxy
+
+
+def ply(material, angle, thickness=0.125):
+    return PlyProperties.from_material_type(material, thickness, angle)
+
+
+@pytest.fixture(params=[True, False], ids=['numba', 'numpy'])
+def numba_enabled(request, monkeypatch):
+    '''Run a test with the compiled kernels and with the NumPy fallbacks'''
+    if request.param and not custom_composite._HAS_NUMBA:
+        pytest.skip('numba is not installed')
+    monkeypatch.setattr(custom_composite, '_HAS_NUMBA', request.param)
+    return request.param
+
+
+@pytest.fixture
+def plies():
+    return [ply(MaterialType.CARBON_T300, 0), ply(MaterialType.GLASS_E, 45, 0.2),
+            ply(MaterialType.KEVLAR_49, -45, 0.15), ply(MaterialType.CARBON_T300, 90)]
+
+
+def assert_layups_match(layup, reference):
+    for M, M_reference in zip(layup.calculate_ABD_matrices(), reference.calculate_ABD_matrices()):
+        np.testing.assert_allclose(M, M_reference, rtol=1e-10, atol=1e-9)
+    properties = layup.calculate_effective_properties()
+    for key, value in reference.calculate_effective_properties().items():
+        np.testing.assert_allclose(properties[key], value, rtol=1e-10)
+    stresses = layup.get_ply_stresses_batch(LOADS.T)
+    for key, value in reference.get_ply_stresses_batch(LOADS.T).items():
+        np.testing.assert_allclose(stresses[key], value, rtol=1e-8, atol=1e-9)
+
+
+@pytest.mark.parametrize('index, new_ply', [
+    (1, ply(MaterialType.CARBON_T300, 30, 0.2)),   # angle and material
+    (3, ply(MaterialType.GLASS_E, 0)),             # material only
+    (2, ply(MaterialType.KEVLAR_49, -45, 0.3))     # thickness: full rebuild
+])
+def test_warm_update_matches_rebuild(numba_enabled, plies, index, new_ply):
+    layup = CustomLayup(plies)
+    layup.calculate_effective_properties()  # Fill the cache the update starts from
+    layup.warm_ABD_update(index, new_ply)
+
+    plies[index] = new_ply
+    assert_layups_match(layup, CustomLayup(plies))
+
+
+def test_warm_update_to_symmetric(numba_enabled):
+    '''Completing the mirror image of a layup makes B exactly zero'''
+    plies = [ply(MaterialType.CARBON_T300, a) for a in (0, 45, 45, 0)]
+    layup = CustomLayup(plies)
+    layup.calculate_effective_properties()
+    layup.warm_ABD_update(2, ply(MaterialType.CARBON_T300, -45))
+    layup.warm_ABD_update(1, ply(MaterialType.CARBON_T300, -45))
+
+    _, B, _ = layup.calculate_ABD_matrices()
+    assert not B.any()
+    plies[1] = plies[2] = ply(MaterialType.CARBON_T300, -45)
+    assert_layups_match(layup, CustomLayup(plies))
+
+
+def test_ABD_copies_survive_warm_update(plies):
+    layup = CustomLayup(plies)
+    A, B, D = layup.calculate_ABD_matrices()
+    A_before = A.copy()
+    A *= 2  # Must not reach the cached factorization
+    layup.warm_ABD_update(1, ply(MaterialType.CARBON_T300, 30, 0.2))
+
+    plies[1] = ply(MaterialType.CARBON_T300, 30, 0.2)
+    np.testing.assert_array_equal(A, 2 * A_before)
+    assert_layups_match(layup, CustomLayup(plies))
+
+
+def test_ply_stresses_batch_matches_single(numba_enabled, plies):
+    layup = CustomLayup(plies)
+    batch = layup.get_ply_stresses_batch(LOADS.T)
+    for k in range(LOADS.shape[1]):
+        single = layup.get_ply_stresses(dict(zip(('Nx', 'Ny', 'Nxy', 'Mx', 'My', 'Mxy'), LOADS[:, k])))
+        for n, ply_result in enumerate(single):
+            for key in ('strain_global', 'strain_material', 'stress_global', 'stress_material'):
+                np.testing.assert_allclose(batch[key][k, n], ply_result[key], rtol=1e-10)
+
+
+def test_evaluate_layups_batch_matches_loop(numba_enabled, plies):
+    layups = [
+        CustomLayup(plies),
+        CustomLayup(plies[:2]),
+        [{'material_type': MaterialType.GLASS_E, 'thickness': 0.2, 'orientation': angle}
+         for angle in (0, 90, 90, 0)]
+    ]
+    properties, stresses = evaluate_layups_batch(layups, LOADS)
+
+    references = [layups[0], layups[1], custom_composite.create_layup_from_sequence(layups[2])]
+    for l, reference in enumerate(references):
+        for key, value in reference.calculate_effective_properties().items():
+            np.testing.assert_allclose(properties[key][l], value, rtol=1e-10)
+
+        n = len(reference.plies)
+        batch = reference.get_ply_stresses_batch(LOADS.T)
+        assert stresses['mask'][l].sum() == n
+        for key in ('stress_material', 'stress_global'):
+            np.testing.assert_allclose(stresses[key][l, :n], batch[key].transpose(1, 2, 0),
+                                       rtol=1e-8, atol=1e-9)
+            assert np.isnan(stresses[key][l, n:]).all()
+
+
+@pytest.mark.parametrize('short', ['E11', 'nu12', 'orientation', 'density'])
+def test_from_arrays_rejects_short_arrays(short):
+    arrays = dict(E11=[138., 45.], E22=[9., 12.], nu12=[0.3, 0.3], G12=[6.9, 5.5],
+                  thickness=[0.125, 0.2], orientation=[0., 90.], density=[1600., 2000.])
+    arrays[short] = arrays[short][:1]
+    with pytest.raises(ValueError, match=short):
+        custom_composite.create_layup_from_arrays(**arrays)
@@ -0,0 +1,80 @@
+'''
+Test of ForkSimulation
+======================
+
+Test the stress calculations of fork_simulation.py against the beam formulas
+for a hollow circular tube, and the step response against its closed form with
+each of the compiled, numexpr and NumPy paths.
+'''
+
+import pytest
+import numpy as np
+
+import fork_simulation
+from fork_simulation import MaterialProperties, ForkGeometry, ForkSimulation
+
+
+AXIAL_FORCE = 1000.      # N
+TRANSVERSE_FORCE = 500.  # N
+
+
+@pytest.fixture(params=['numba', 'numexpr', 'numpy'])
+def step_path(request, monkeypatch):
+    '''Run a test with each way of evaluating the underdamped step response'''
+    flags = {'numba': '_HAS_NUMBA', 'numexpr': '_HAS_NUMEXPR'}
+    if request.param in flags and not getattr(fork_simulation, flags[request.param]):
+        pytest.skip(f'{request.param} is not installed')
+    for path, flag in flags.items():
+        if path != request.param:
+            monkeypatch.setattr(fork_simulation, flag, False)
+    return request.param
+
+
+@pytest.fixture
+def fork():
+    material = MaterialProperties(E_axial=120, E_transverse=8, G=4.5, nu=0.3, rho=1600,
+                                  cost_per_kg=50, damping_ratio=0.01)
+    geometry = ForkGeometry(length=0.4, outer_diameter=0.03, wall_thickness=0.002)
+    return ForkSimulation(material, geometry)
+
+
+def test_stress_tensor_field_hand_values(fork):
+    '''sigma_xx = F/A + P*x*(D/2)/I for a tube of D = 30 mm and d = 26 mm'''
+    x = np.array([0., 0.1, 0.4])
+    area = np.pi * (0.03**2 - 0.026**2) / 4
+    inertia = np.pi * (0.03**4 - 0.026**4) / 64
+    reference = AXIAL_FORCE / area + TRANSVERSE_FORCE * x * 0.015 / inertia
+
+    tensor = fork.stress_tensor_field(AXIAL_FORCE, TRANSVERSE_FORCE, x)
+    assert tensor.shape == (3, 3, 3)
+    np.testing.assert_allclose(tensor[:, 0, 0], reference, rtol=1e-12)
+
+
+def test_stress_tensor_field_is_uniaxial(fork):
+    x = np.linspace(0, 0.4, 7)
+    tensor = fork.stress_tensor_field(AXIAL_FORCE, TRANSVERSE_FORCE, x)
+    others = tensor.copy()
+    others[:, 0, 0] = 0
+    assert not others.any()
+
+
+def test_stress_tensor_field_matches_distribution(fork):
+    x, axial, bending, total = fork.stress_distribution(AXIAL_FORCE, TRANSVERSE_FORCE)
+    tensor = fork.stress_tensor_field(AXIAL_FORCE, TRANSVERSE_FORCE, x)
+    # The distribution is sampled in single precision
+    np.testing.assert_allclose(tensor[:, 0, 0], total, rtol=1e-6)
+    np.testing.assert_allclose(axial + bending, total, rtol=1e-6)
+
+
+@pytest.mark.parametrize('dtype', [np.float32, np.float64])
+def test_underdamped_step_response(step_path, dtype):
+    static, omega_n, zeta = 2e-3, 150., 0.05
+    t = np.linspace(0, 0.5, 500, dtype=dtype)
+    response = fork_simulation._step_response(t, static, omega_n, zeta)
+    assert response.dtype == dtype
+
+    t = t.astype(np.float64)
+    omega_d = omega_n * np.sqrt(1 - zeta**2)
+    reference = static * (1 - np.exp(-zeta * omega_n * t) * (
+        np.cos(omega_d * t) + zeta * omega_n / omega_d * np.sin(omega_d * t)))
+    np.testing.assert_allclose(response, reference, atol=static * (1e-5 if dtype == np.float32 else 1e-12))